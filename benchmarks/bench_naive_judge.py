@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark NaiveJudge.judge on a synthetic response set: bulk (columnar) vs. per-response mode.
+
+    python benchmarks/bench_naive_judge.py              # 1M responses
+    python benchmarks/bench_naive_judge.py -n 100000
+
+Building the synthetic Reports is not timed; each mode's judge(...) call is,
+including leaderboard build and verification.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from autojudge_base import Report
+from autojudge_base.report import ReportMetaData
+from autojudge_base.report_sentences import Rag24ReportSentence
+
+from judges.naive.naive_baseline import NaiveJudge
+
+WORDS = ["leaf", "chlorophyll", "the", "autumn", "tree", "colour\n", "water", "of", "a"]
+
+
+def synthetic_reports(n: int, topics: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    sentences = [" ".join(rng.choices(WORDS, k=rng.randint(5, 40))) for _ in range(1000)]
+    return [
+        Report(
+            metadata=ReportMetaData(team_id="bench", run_id=f"run-{i // topics:05d}", topic_id=f"topic-{i % topics:04d}"),
+            responses=[Rag24ReportSentence(text=s, citations=[]) for s in rng.sample(sentences, 3)],
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--responses", type=int, default=1_000_000)
+    parser.add_argument("--topics", type=int, default=100)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    reports = synthetic_reports(args.responses, args.topics)
+    print(f"built {len(reports):,d} synthetic reports in {time.perf_counter() - started:.1f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for bulk in (False, True):
+            started = time.perf_counter()
+            NaiveJudge().judge(reports, [], None, filebase=str(Path(tmp) / "naive"), bulk=bulk)
+            elapsed = time.perf_counter() - started
+            name = "bulk (columnar)" if bulk else "per-response"
+            print(f"{name:16s} {len(reports):>9,d} responses  {elapsed:7.2f}s  {len(reports) / elapsed:>10,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
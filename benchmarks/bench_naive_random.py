@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark NaiveJudge's RANDOM measure: keyed blake2b vs. the old reseeded Mersenne Twister.
+
+    python benchmarks/bench_naive_random.py            # 1M responses
+    python benchmarks/bench_naive_random.py -n 100000
+"""
+
+import argparse
+import random
+import time
+
+from judges.naive.naive_baseline import rand
+
+
+def legacy_global_rand(seed: str) -> float:
+    """The original implementation: reseed the process-global RNG per response."""
+    random.seed(seed)
+    return random.random()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--responses", type=int, default=1_000_000)
+    parser.add_argument("--topics", type=int, default=100)
+    args = parser.parse_args()
+
+    runs = max(1, args.responses // args.topics)
+    seeds = [f"run-{r:05d}" + f"topic-{t:04d}" for r in range(runs) for t in range(args.topics)]
+
+    for name, fn in [
+        ("random.seed (original)", legacy_global_rand),
+        ("rand(compat=True)", lambda s: rand(s, compat=True)),
+        ("rand (blake2b)", rand),
+    ]:
+        started = time.perf_counter()
+        for seed in seeds:
+            fn(seed)
+        elapsed = time.perf_counter() - started
+        print(f"{name:24s} {len(seeds):>9,d} responses  {elapsed:7.2f}s  {len(seeds) / elapsed:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
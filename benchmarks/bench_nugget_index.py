@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-response nugget-bank walks vs. a per-topic summary index built once.
+
+    python benchmarks/bench_nugget_index.py                  # 20 topics x 5000 nuggets, 200 responses/topic
+    python benchmarks/bench_nugget_index.py --nuggets 20000
+
+"per-response" is what ExampleLeaderboardJudge used to do for every response,
+len(banks[topic_id].nuggets_as_list()); "index" builds build_nugget_index once and
+looks the topic up per response.
+"""
+
+import argparse
+import time
+
+from autojudge_base.nugget_data import NuggetBank, NuggetBanks, NuggetQuestion
+
+from judges.shared.nugget_index import build_nugget_index
+
+
+def synthetic_banks(topics: int, nuggets: int) -> NuggetBanks:
+    banks = []
+    for t in range(topics):
+        bank = NuggetBank(query_id=f"topic-{t}", title_query=f"Topic {t}")
+        bank.add_nuggets([
+            NuggetQuestion.from_lazy(f"topic-{t}", f"Q{i} about topic {t}?", [f"answer {i}", f"alt {i}"])
+            for i in range(nuggets)
+        ])
+        banks.append(bank)
+    return NuggetBanks.from_banks_list(banks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--nuggets", type=int, default=5000, help="Nuggets per topic")
+    parser.add_argument("--responses", type=int, default=200, help="Responses per topic")
+    args = parser.parse_args()
+
+    banks = synthetic_banks(args.topics, args.nuggets)
+    lookups = [topic_id for topic_id in banks.banks for _ in range(args.responses)]
+
+    started = time.perf_counter()
+    old = [len(banks.banks[topic_id].nuggets_as_list()) for topic_id in lookups]
+    per_response = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = build_nugget_index(banks)
+    built = time.perf_counter() - started
+    new = [index[topic_id].count for topic_id in lookups]
+    looked_up = time.perf_counter() - started - built
+
+    assert old == new
+    print(f"{len(lookups):,d} lookups, {args.topics} topics x {args.nuggets:,d} nuggets")
+    print(f"per-response nuggets_as_list  {per_response:8.3f}s")
+    print(f"index build (once)            {built:8.3f}s")
+    print(f"index lookups                 {looked_up:8.3f}s  ({per_response / max(looked_up, 1e-9):,.0f}x faster per lookup)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark qrels construction: GradeRecord objects + build_qrels vs. columnar sort/group.
+
+    python benchmarks/bench_qrels_columns.py            # 1M graded responses
+    python benchmarks/bench_qrels_columns.py -n 200000
+
+Both paths include writing the TREC qrels file; the outputs are compared.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from autojudge_base.qrels.qrels import build_qrels, doc_id_md5, write_qrel_file
+
+from judges.complete_example.example_judge import MINIMAL_QRELS_SPEC, GradeRecord
+from judges.shared.columnar import write_qrels_columns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--responses", type=int, default=1_000_000)
+    parser.add_argument("--topics", type=int, default=100)
+    parser.add_argument("--duplicates", type=float, default=0.1, help="Fraction of repeated (topic, doc) pairs")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    unique = int(args.responses * (1 - args.duplicates))
+    pairs = [(f"topic-{i % args.topics}", doc_id_md5(str(i))) for i in range(unique)]
+    pairs += rng.choices(pairs, k=args.responses - unique)
+    topic_ids = [t for t, _ in pairs]
+    doc_ids = [d for _, d in pairs]
+    grades = [rng.randint(0, 3) for _ in pairs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        objects_file, columns_file = Path(tmp) / "objects.qrels.txt", Path(tmp) / "columns.qrels.txt"
+
+        started = time.perf_counter()
+        records = [GradeRecord(t, "", g, doc_id=d) for t, d, g in zip(topic_ids, doc_ids, grades)]
+        write_qrel_file(qrel_out_file=objects_file, qrels=build_qrels(records=records, spec=MINIMAL_QRELS_SPEC))
+        objects_s = time.perf_counter() - started
+        del records
+
+        started = time.perf_counter()
+        write_qrels_columns(columns_file, topic_ids, doc_ids, grades, on_duplicate="keep_max")
+        columns_s = time.perf_counter() - started
+
+        assert objects_file.read_bytes() == columns_file.read_bytes()
+
+    print(f"{args.responses:,d} graded responses, {unique:,d} unique (topic, doc) pairs")
+    print(f"GradeRecord + build_qrels + write  {objects_s:7.2f}s")
+    print(f"columnar sort/group + streaming    {columns_s:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
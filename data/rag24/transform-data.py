@@ -1,8 +1,22 @@
 #!/usr/bin/env python3
+"""
+Build runs/generation/*.jsonl and topics/topics_rag24.jsonl from the TREC RAG 2024 release.
+
+Streaming: the nugget assignments are read once (md5 checked on the fly),
+each run is read and written line by line, and cited segments are fetched
+from msmarco-segment-v2.1 with `get_many` through an LRU cache. Runs are
+processed in parallel, one worker process per run.
+
+    python3 transform-data.py [--jobs N] [--cache-size N]
+"""
+from argparse import ArgumentParser
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from hashlib import md5
 from pathlib import Path
 import json
 import gzip
+import os
 try:
     from tqdm import tqdm
 except ImportError:  # tqdm ships in the [all] extra; fall back to a no-op wrapper
@@ -11,71 +25,155 @@ except ImportError:  # tqdm ships in the [all] extra; fall back to a no-op wrapp
 import ir_datasets
 
 EXPECTED_MD5 = "918bb96e714eec2e3a0c64d0771a6a6f"
+NUGGET_FILE = "nugget_assignment.20241108.jl.jl"
+MIN_RESPONSES_PER_RUN = 20
+LOOKUP_BATCH = 64           # responses per get_many call
+DEFAULT_CACHE_SIZE = 100_000
 
 
 def read_all_lines():
-    txt = Path("nugget_assignment.20241108.jl.jl").read_text()
-    actual_md5 = md5(txt.encode("UTF-8")).hexdigest()
-    assert actual_md5 == EXPECTED_MD5
-    for l in txt.split("\n"):
-        if not l:
-            continue
-        yield json.loads(l)
+    """Parsed lines of the nugget file; the md5 is checked once the last line is read."""
+    digest = md5()
+    with open(NUGGET_FILE, encoding="utf-8") as f:
+        for l in f:
+            digest.update(l.encode("UTF-8"))
+            l = l.rstrip("\n")
+            if not l:
+                continue
+            yield json.loads(l)
+    assert digest.hexdigest() == EXPECTED_MD5
 
 
-def extract_topics():
+def scan_assignments():
+    """One pass over the nugget file: {qid: query} and the run ids that were assessed."""
     qid_to_topic = {}
-    for topic in read_all_lines():
-        qid_to_topic[topic["qid"]] = topic["query"]
-    
+    run_ids = set()
+    for assignment in read_all_lines():
+        qid_to_topic[assignment["qid"]] = assignment["query"]
+        run_ids.add(assignment["run_id"])
+    return qid_to_topic, run_ids
+
+
+def write_topics(qid_to_topic):
     Path("topics").mkdir(parents=True, exist_ok=True)
     with open("topics/topics_rag24.jsonl", "w") as f:
         for qid, title in qid_to_topic.items():
             f.write(json.dumps({"request_id": qid, "title": title}) + "\n")
 
 
-def extract_responses():
+def normalize_run_id(run_id):
+    run_id = run_id.split(".")[0]
+    return run_id.replace("manual-manual", "manual")
+
+
+class SegmentLookup:
+    """msmarco-segment-v2.1 segments as (text, title), batched via get_many, with an LRU cache."""
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        self.ds = ir_datasets.load("msmarco-segment-v2.1").docs_store()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def fetch(self, doc_ids):
+        missing = [d for d in dict.fromkeys(doc_ids) if d not in self.cache]
+        if missing:
+            found = self.ds.get_many(missing)
+            for doc_id in missing:
+                doc = found[doc_id]   # KeyError for unknown segments, like ds.get
+                self.cache[doc_id] = (doc.default_text(), doc.title)
+        ret = {}
+        for doc_id in doc_ids:
+            self.cache.move_to_end(doc_id)
+            ret[doc_id] = self.cache[doc_id]
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return ret
+
+
+_lookup = None
+
+
+def _init_worker(cache_size):
+    global _lookup
+    _lookup = SegmentLookup(cache_size)
+
+
+def read_run(run_id, topic_ids):
+    """Responses of one run for the assessed topics, in file order (unparseable lines are skipped)."""
+    with gzip.open(f"raw-responses/{run_id}.gz", "rt") as f:
+        for l in f:
+            try:
+                l = json.loads(l)
+                topic_id = l["topic_id"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+            if topic_id not in topic_ids:
+                continue
+            l["run_id"] = run_id
+            l["metadata"] = {"team_id": run_id, "run_id": run_id, "topic_id": topic_id, "request_id": topic_id, "narrative_id": topic_id}
+            yield l
+
+
+def _write_batch(f, batch):
+    segments = _lookup.fetch([r for response in batch for r in response["references"]])
+    for response in batch:
+        docs = {}
+        for r in response["references"]:
+            text, title = segments[r]
+            docs[r] = {"id": r, "text": text, "title": title}
+        response["documents"] = docs
+        f.write(json.dumps(response) + "\n")
+
+
+def transform_run(run_id, topic_ids):
+    """Write runs/generation/{run_id}.jsonl; returns the number of responses (no file if 0)."""
+    out = Path(f"runs/generation/{run_id}.jsonl")
+    tmp = out.with_suffix(".jsonl.tmp")
+    count = 0
+    with open(tmp, "w") as f:
+        batch = []
+        for response in read_run(run_id, topic_ids):
+            batch.append(response)
+            count += 1
+            if len(batch) == LOOKUP_BATCH:
+                _write_batch(f, batch)
+                batch = []
+        if batch:
+            _write_batch(f, batch)
+
+    if count == 0:
+        tmp.unlink()
+        return 0
+    if count < MIN_RESPONSES_PER_RUN:
+        tmp.unlink()
+        raise AssertionError(f"{run_id}: only {count} responses")
+    tmp.replace(out)
+    return count
+
+
+def extract_responses(run_ids, topic_ids, jobs=1, cache_size=DEFAULT_CACHE_SIZE):
     Path("runs/generation/").mkdir(parents=True, exist_ok=True)
-    run_ids = set()
-    topic_ids = set()
-    run_id_to_responses = {}
-    ds = ir_datasets.load("msmarco-segment-v2.1").docs_store()
-
-    for response in read_all_lines():
-        run_ids.add(response["run_id"])
-        topic_ids.add(response["qid"])
-
-    for run_id in run_ids:
-        run_id = run_id.split(".")[0]
-        run_id = run_id.replace("manual-manual", "manual")
-        with gzip.open(f"raw-responses/{run_id}.gz", "rt") as f:
-            for l in f:
-                try:
-                    l = json.loads(l)
-                    if l["topic_id"] not in topic_ids:
-                        continue
-                    if run_id not in run_id_to_responses:
-                        run_id_to_responses[run_id] = []
-                    l["run_id"] = run_id
-                    
-                    l["metadata"] = {"team_id": run_id, "run_id": run_id, "topic_id": l["topic_id"], "request_id": l["topic_id"], "narrative_id": l["topic_id"]}
-                    
-                    run_id_to_responses[run_id].append(l)
-                except:
-                    pass
-
-    for run_id in run_id_to_responses.keys():
-        assert len(run_id_to_responses[run_id]) > 19, run_id
-        with open(f"runs/generation/{run_id}.jsonl", "w") as f:
-            for response in tqdm(run_id_to_responses[run_id]):
-                docs = {}
-                for r in response["references"]:
-                    doc = ds.get(r)
-                    docs[r] = {"id": r, "text": doc.default_text(), "title": doc.title}
-                response["documents"] = docs
-                f.write(json.dumps(response) + "\n")
+    runs = sorted({normalize_run_id(run_id) for run_id in run_ids})
+    topic_ids = frozenset(topic_ids)
+
+    if jobs <= 1:
+        _init_worker(cache_size)
+        for run_id in tqdm(runs):
+            transform_run(run_id, topic_ids)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(cache_size,)) as pool:
+        futures = [pool.submit(transform_run, run_id, topic_ids) for run_id in runs]
+        for future in tqdm(as_completed(futures), total=len(futures)):
+            future.result()
 
 
 if __name__ == '__main__':
-    extract_topics()
-    extract_responses()
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=min(8, os.cpu_count() or 1), help="Runs transformed in parallel.")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="Segments kept per worker.")
+    args = parser.parse_args()
+
+    qid_to_topic, run_ids = scan_assignments()
+    write_topics(qid_to_topic)
+    extract_responses(run_ids, qid_to_topic.keys(), jobs=args.jobs, cache_size=args.cache_size)
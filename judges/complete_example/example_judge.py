@@ -13,15 +13,17 @@ No LLM calls are used - all logic is deterministic based on text length and keyw
 Use this as a reference for building judges that use nuggets and qrels.
 """
 
+import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Pattern, Sequence, Tuple, Type, Union
+
+import numpy as np
 
 from autojudge_base import (
     LlmConfigProtocol,
     Report,
     Request,
     Leaderboard,
-    LeaderboardBuilder,
     LeaderboardSpec,
     MeasureSpec,
     Qrels,
@@ -36,6 +38,13 @@ from autojudge_base.nugget_data import (
     NuggetQuestion,
 )
 
+from judges.shared.columnar import ColumnarLeaderboardBuilder, build_qrels_columns
+from judges.shared.nugget_index import NuggetSummary, build_nugget_index
+from judges.shared.phase_cache import shared_phase
+from judges.shared.report_memo import DEFAULT_MAX_ENTRIES, ReportTextMemo, report_text_memo
+from judges.shared.sweepable import point_filebase, sweep_grid, write_point_leaderboard
+from judges.shared.topic_pool import group_by_topic, map_topics
+
 
 # =============================================================================
 # Leaderboard Specification
@@ -55,15 +64,18 @@ MINIMAL_SPEC = LeaderboardSpec(measures=(
 
 class GradeRecord:
     """Simple record for qrels building."""
-    def __init__(self, topic_id: str, text: str, grade: int):
+    __slots__ = ("topic_id", "text", "grade", "doc_id")
+
+    def __init__(self, topic_id: str, text: str, grade: int, doc_id: Optional[str] = None):
         self.topic_id = topic_id
         self.text = text
         self.grade = grade
+        self.doc_id = doc_id if doc_id is not None else doc_id_md5(text)  # Hash response text as doc_id
 
 
 MINIMAL_QRELS_SPEC = QrelsSpec[GradeRecord](
     topic_id=lambda r: r.topic_id,
-    doc_id=lambda r: doc_id_md5(r.text),  # Hash response text as doc_id
+    doc_id=lambda r: r.doc_id,
     grade=lambda r: r.grade,
     on_duplicate="keep_max",  # Keep highest grade if duplicates
 )
@@ -84,6 +96,7 @@ class ExampleNuggetCreator:
     # Declare the nugget format this creator produces
     nugget_banks_type: Type[NuggetBanksProtocol] = NuggetBanks
 
+    @shared_phase
     def create_nuggets(
         self,
         rag_responses: Iterable[Report],
@@ -137,6 +150,7 @@ class ExampleQrelsCreator:
     to assess relevance. Here we use a simple length-based heuristic.
     """
 
+    @shared_phase
     def create_qrels(
         self,
         rag_responses: Iterable[Report],
@@ -146,17 +160,30 @@ class ExampleQrelsCreator:
         # Settings from workflow.yml qrels_settings
         grade_range: Tuple[int, int] = (0, 3),
         length_threshold: int = 100,
+        # Shared settings from workflow.yml
+        report_memo: bool = True,
+        report_memo_max_entries: int = DEFAULT_MAX_ENTRIES,
+        columnar_qrels: bool = True,
         # Standard output path settings (auto-filled by judge_runner)
         filebase: str = "default",
         outdir: Path = Path("."),
         **kwargs: Any,
     ) -> Optional[Qrels]:
-        """Create relevance judgments for each response."""
+        """Create relevance judgments for each response.
+
+        With `columnar_qrels` the grades are collected as parallel columns and
+        deduplicated by sort/group (judges.shared.columnar) instead of one
+        GradeRecord per response; the qrels are the same.
+        """
         grade_records: List[GradeRecord] = []
+        topic_ids: List[str] = []
+        doc_ids: List[str] = []
+        grades: List[int] = []
+        memo: ReportTextMemo = report_text_memo(report_memo, report_memo_max_entries)
 
         for response in rag_responses:
             topic_id = response.metadata.topic_id
-            text = response.get_report_text()
+            text = memo.text(response)
 
             # Simple grading heuristic (replace with LLM in real judge)
             text_length = len(text)
@@ -169,10 +196,18 @@ class ExampleQrelsCreator:
             else:
                 grade = grade_range[0]  # Poor
 
-            grade_records.append(GradeRecord(topic_id, text, grade))
+            if columnar_qrels:
+                topic_ids.append(topic_id)
+                doc_ids.append(memo.doc_id(response))
+                grades.append(grade)
+            else:
+                grade_records.append(GradeRecord(topic_id, text, grade, doc_id=memo.doc_id(response)))
 
-        qrels = build_qrels(records=grade_records, spec=MINIMAL_QRELS_SPEC)
-        print(f"ExampleQrelsCreator: Created qrels for {len(grade_records)} responses")
+        if columnar_qrels:
+            qrels = build_qrels_columns(topic_ids, doc_ids, grades, on_duplicate=MINIMAL_QRELS_SPEC.on_duplicate)
+        else:
+            qrels = build_qrels(records=grade_records, spec=MINIMAL_QRELS_SPEC)
+        print(f"ExampleQrelsCreator: Created qrels for {len(grades) or len(grade_records)} responses")
         return qrels
 
 
@@ -188,6 +223,9 @@ class ExampleLeaderboardJudge:
     and keyword matching from topic titles.
     """
 
+    # Only enter the final score, so a list of values is scored in one pass
+    sweepable_params = ("keyword_bonus",)
+
     def judge(
         self,
         rag_responses: Iterable[Report],
@@ -196,70 +234,173 @@ class ExampleLeaderboardJudge:
         nugget_banks: Optional[NuggetBanksProtocol] = None,
         qrels: Optional[Qrels] = None,
         # Settings from workflow.yml judge_settings
-        keyword_bonus: float = 0.2,
+        keyword_bonus: Union[float, List[float]] = 0.2,
+        keyword_match: str = "substring",
         on_missing_evals: str = "fix_aggregate",
+        topic_workers: int = 1,
+        sweep_filebase: str = "{filebase}-b{keyword_bonus}",
+        # Shared settings from workflow.yml
+        report_memo: bool = True,
+        report_memo_max_entries: int = DEFAULT_MAX_ENTRIES,
         # Standard output path settings (auto-filled by judge_runner)
         filebase: str = "default",
         outdir: Path = Path("."),
         **kwargs: Any,
     ) -> Leaderboard:
-        """Judge RAG responses and produce a leaderboard."""
+        """Judge RAG responses and produce a leaderboard.
+
+        Topics are scored independently; `topic_workers > 1` spreads them over
+        that many processes (see judges.shared.topic_pool). The leaderboard is
+        the same for any worker count.
+
+        `keyword_match` decides what counts as a title keyword in the response:
+        "substring" (any occurrence, e.g. "leaf" in "leaflet") or "word" (whole
+        words only).
+
+        `keyword_bonus` may be a list (see judges.shared.sweepable). Length and
+        keyword features are computed once, and each bonus gets its own
+        leaderboard. The returned leaderboard is the first bonus's, which the
+        runner saves as `{filebase}.eval.txt`; the other bonuses are written
+        to `sweep_filebase` + ".eval.txt".
+        """
+        if keyword_match not in KEYWORD_MATCH_MODES:
+            raise ValueError(f"keyword_match must be one of {KEYWORD_MATCH_MODES}, got {keyword_match!r}")
+        points: List[Dict[str, Any]] = sweep_grid({"keyword_bonus": keyword_bonus}, self.sweepable_params)
         expected_topic_ids: List[str] = [t.request_id for t in rag_topics]
         topic_titles: Dict[str, str] = {t.request_id: (t.title or "").lower() for t in rag_topics}
 
-        builder: LeaderboardBuilder = LeaderboardBuilder(MINIMAL_SPEC)
-
-        for response in rag_responses:
-            run_id: str = response.metadata.run_id
-            topic_id: str = response.metadata.topic_id
-            text: str = response.get_report_text().lower()
+        nugget_index: Dict[str, NuggetSummary] = build_nugget_index(nugget_banks)
+        memo: ReportTextMemo = report_text_memo(report_memo, report_memo_max_entries)
 
-            # Base score from text length (normalize to 0-1)
-            base_score: float = min(len(text) / 1000.0, 1.0)
+        # One picklable task per topic: only what scoring needs, not whole Reports
+        tasks: Dict[str, _TopicTask] = {}
+        for topic_id, responses in group_by_topic(rag_responses).items():
+            tasks[topic_id] = _TopicTask(
+                title=topic_titles.get(topic_id, ""),
+                keyword_match=keyword_match,
+                responses=[(r.metadata.run_id, memo.lower(r)) for r in responses],
+            )
 
-            # Check for keywords from topic title
-            title_words: List[str] = topic_titles.get(topic_id, "").split()
-            keywords_found: int = sum(1 for word in title_words if word in text)
-            has_keywords: bool = keywords_found > 0
+        # Optionally use qrels (could adjust score based on grades)
+        if qrels:
+            pass
+
+        # Bonus-independent features, one row per response
+        run_ids: List[str] = []
+        topic_ids: List[str] = []
+        base_scores: List[float] = []
+        has_keywords: List[bool] = []
+        nugget_counts: List[int] = []
+        for topic_id, features in map_topics(_topic_features, tasks, workers=topic_workers).items():
+            # Optionally use nuggets for additional scoring
+            summary: Optional[NuggetSummary] = nugget_index.get(topic_id)
+            for run_id, base_score, has in features:
+                run_ids.append(run_id)
+                topic_ids.append(topic_id)
+                base_scores.append(base_score)
+                has_keywords.append(has)
+                nugget_counts.append(summary.count if summary else 0)
+
+        bonuses = np.array([point["keyword_bonus"] for point in points], dtype=np.float64)
+        scores: np.ndarray = score_grid(
+            np.array(base_scores, dtype=np.float64),
+            np.array(has_keywords, dtype=bool),
+            np.array(nugget_counts, dtype=np.int64),
+            bonuses,
+        )
 
-            # Apply keyword bonus
-            score: float = base_score
-            if has_keywords:
-                score = min(score + keyword_bonus, 1.0)
+        leaderboards: List[Leaderboard] = []
+        for index, (point, point_scores) in enumerate(zip(points, scores)):
+            builder = ColumnarLeaderboardBuilder(MINIMAL_SPEC)
+            builder.add_columns(
+                run_ids=run_ids,
+                topic_ids=topic_ids,
+                columns={"SCORE": point_scores, "HAS_KEYWORDS": has_keywords},
+            )
+            leaderboard = builder.build(
+                expected_topic_ids=expected_topic_ids,
+                on_missing=on_missing_evals,
+            )
 
-            # Optionally use nuggets for additional scoring
-            if nugget_banks and topic_id in nugget_banks.banks:
-                bank = nugget_banks.banks[topic_id]
-                nugget_count = len(bank.nuggets_as_list())
-                if nugget_count > 0:
-                    score = min(score + 0.05 * nugget_count, 1.0)
-
-            # Optionally use qrels (could adjust score based on grades)
-            if qrels:
-                pass
-
-            builder.add(
-                run_id=run_id,
-                topic_id=topic_id,
-                values={
-                    "SCORE": score,
-                    "HAS_KEYWORDS": has_keywords,
-                },
+            leaderboard.verify(
+                expected_topic_ids=expected_topic_ids,
+                warn=True,
+                on_missing=on_missing_evals,
             )
 
-        leaderboard = builder.build(
-            expected_topic_ids=expected_topic_ids,
-            on_missing=on_missing_evals,
-        )
+            if index > 0:  # the runner writes the returned first point to {filebase}.eval.txt
+                path = write_point_leaderboard(leaderboard, point_filebase(sweep_filebase, filebase, point), rag_topics)
+                print(f"ExampleLeaderboardJudge: {point} leaderboard saved to {path}")
+            leaderboards.append(leaderboard)
+
+        print(f"ExampleLeaderboardJudge: Built leaderboard with {len(leaderboards[0].entries)} entries")
+        return leaderboards[0]
 
-        leaderboard.verify(
-            expected_topic_ids=expected_topic_ids,
-            warn=True,
-            on_missing=on_missing_evals,
-        )
 
-        print(f"ExampleLeaderboardJudge: Built leaderboard with {len(leaderboard.entries)} entries")
-        return leaderboard
+class _TopicTask(NamedTuple):
+    """Everything needed to score one topic's responses (sent to worker processes)."""
+    title: str
+    keyword_match: str
+    responses: List[Tuple[str, str]]  # (run_id, lowercased report text)
+
+
+TopicFeatures = List[Tuple[str, float, bool]]  # [(run_id, base_score, has_keywords), ...] for one topic
+
+
+KEYWORD_MATCH_MODES = ("substring", "word")
+
+
+def keyword_matcher(title: str, mode: str = "substring") -> Optional[Pattern[str]]:
+    """One compiled alternation over the (lowercased) title words; None if the title has none.
+
+    A single `search` over the report finds whether any title word occurs, as a
+    substring ("substring") or as a whole word ("word").
+    """
+    words = sorted(set(title.split()), key=len, reverse=True)
+    if not words:
+        return None
+    alternation = "|".join(map(re.escape, words))
+    if mode == "word":
+        return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)")
+    return re.compile(alternation)
+
+
+def _topic_features(task: _TopicTask) -> TopicFeatures:
+    """(run_id, base_score, has_keywords) per response. Module-level so worker processes can unpickle it."""
+    matcher: Optional[Pattern[str]] = keyword_matcher(task.title, task.keyword_match)
+    features: TopicFeatures = []
+    for run_id, text in task.responses:
+
+        # Base score from text length (normalize to 0-1)
+        base_score: float = min(len(text) / 1000.0, 1.0)
+
+        # Check for keywords from topic title
+        has_keywords: bool = matcher is not None and matcher.search(text) is not None
+
+        features.append((run_id, base_score, has_keywords))
+    return features
+
+
+def score_grid(
+    base_scores: np.ndarray,
+    has_keywords: np.ndarray,
+    nugget_counts: np.ndarray,
+    keyword_bonuses: np.ndarray,
+) -> np.ndarray:
+    """SCORE for every (bonus, response) pair, shape (len(keyword_bonuses), len(base_scores)).
+
+    Same float operations as scoring one response with one bonus, so each row
+    equals a scalar run with that bonus.
+    """
+    # Apply keyword bonus
+    scores = np.where(
+        has_keywords,
+        np.minimum(base_scores + keyword_bonuses[:, None], 1.0),
+        np.broadcast_to(base_scores, (len(keyword_bonuses), len(base_scores))),
+    )
+
+    # Nugget bonus
+    return np.where(nugget_counts > 0, np.minimum(scores + 0.05 * nugget_counts, 1.0), scores)
 
 
 # =============================================================================
@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence, Type
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
 
 from autojudge_base import (
     AutoJudge,
     Report,
     Request,
     LeaderboardSpec,
-    LeaderboardBuilder,
     LeaderboardVerification,
     MeasureSpec,
     auto_judge_to_click_command,
@@ -22,12 +21,28 @@ try:
 except ImportError:  # tqdm ships in the [all] extra; fall back to a no-op wrapper
     def tqdm(iterable, *args, **kwargs):
         return iterable
+import hashlib
 import random
 
+import numpy as np
 
-def rand(seed: str) -> float:
-    random.seed(seed)
-    return random.random()
+from judges.shared.columnar import ColumnarLeaderboardBuilder, count_words
+from judges.shared.metrics import RunMetrics
+
+_RAND_KEY = b"naive-judge/RANDOM"
+
+
+def rand(seed: str, compat: bool = False) -> float:
+    """Deterministic score in [0, 1) for `seed` (run_id + topic_id).
+
+    A keyed blake2b digest: stateless, and leaves the global `random` alone.
+    `compat=True` reproduces the values of the original `random.seed(seed);
+    random.random()` implementation, for comparing against old leaderboards.
+    """
+    if compat:
+        return random.Random(seed).random()
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=8, key=_RAND_KEY).digest()
+    return (int.from_bytes(digest, "big") >> 11) * 2.0**-53
 
 
 NAIVE_LEADERBOARD_SPEC = LeaderboardSpec(measures=(
@@ -69,7 +84,7 @@ class NaiveJudge(AutoJudge):
 
     def judge(
         self,
-        rag_responses: Sequence[Report],
+        rag_responses: Iterable[Report],
         rag_topics: Sequence[Request],
         llm_config: LlmConfigProtocol,
         nugget_banks: Optional[NuggetBanksProtocol] = None,
@@ -78,25 +93,61 @@ class NaiveJudge(AutoJudge):
         # Standard output path settings (auto-filled by judge_runner)
         filebase: str = "default",
         outdir: Path = Path("."),
+        random_compat: bool = False,
+        bulk: bool = True,
         **kwargs: Any,
     ) -> Leaderboard:
-        builder: LeaderboardBuilder = LeaderboardBuilder(NAIVE_LEADERBOARD_SPEC)
-        
-        for rag_response in tqdm(rag_responses, "Process RAG Responses"):
-            vals: Dict[str, float] = {
-                "LENGTH": len(rag_response.get_report_text().split()),
-                "RANDOM": rand(rag_response.metadata.run_id + rag_response.metadata.topic_id),
-            }
-            builder.add(
-                run_id=rag_response.metadata.run_id,
-                topic_id=rag_response.metadata.topic_id,
-                values=vals,
-            )
-
-        leaderboard: Leaderboard = builder.build()
-        LeaderboardVerification(leaderboard, on_missing="fix_aggregate", warn=True).all()
+        builder: ColumnarLeaderboardBuilder = ColumnarLeaderboardBuilder(NAIVE_LEADERBOARD_SPEC)
+        metrics: RunMetrics = RunMetrics()
+
+        with metrics.phase("judge"):
+            if bulk:
+                metrics.count("responses", self._judge_bulk(builder, rag_responses, random_compat))
+            else:
+                for rag_response in tqdm(rag_responses, "Process RAG Responses"):
+                    vals: Dict[str, float] = {
+                        "LENGTH": len(rag_response.get_report_text().split()),
+                        "RANDOM": rand(rag_response.metadata.run_id + rag_response.metadata.topic_id, compat=random_compat),
+                    }
+                    builder.add(
+                        run_id=rag_response.metadata.run_id,
+                        topic_id=rag_response.metadata.topic_id,
+                        values=vals,
+                    )
+                    metrics.count("responses")
+
+        with metrics.phase("build"):
+            leaderboard: Leaderboard = builder.build()
+            LeaderboardVerification(leaderboard, on_missing="fix_aggregate", warn=True).all()
+        metrics.write(filebase)
         return leaderboard
 
+    @staticmethod
+    def _judge_bulk(
+        builder: ColumnarLeaderboardBuilder,
+        rag_responses: Iterable[Report],
+        random_compat: bool,
+    ) -> int:
+        """LENGTH and RANDOM for all responses as arrays, added in one call; returns the response count.
+
+        The columns are collected in one pass, so `rag_responses` may be a generator.
+        """
+        run_ids: List[str] = []
+        topic_ids: List[str] = []
+        texts: List[str] = []
+        for r in rag_responses:
+            run_ids.append(r.metadata.run_id)
+            topic_ids.append(r.metadata.topic_id)
+            texts.append(r.get_report_text())
+        lengths = count_words(texts)
+        scores = np.fromiter(
+            (rand(run_id + topic_id, compat=random_compat) for run_id, topic_id in zip(run_ids, topic_ids)),
+            dtype=np.float64,
+            count=len(run_ids),
+        )
+        builder.add_columns(run_ids=run_ids, topic_ids=topic_ids, columns={"LENGTH": lengths, "RANDOM": scores})
+        return len(run_ids)
+
 
 if __name__ == '__main__':
     auto_judge_to_click_command(NaiveJudge(), "naive-judge")()
@@ -0,0 +1,3 @@
+# Shared helpers for the example judges (no judge lives here, so no workflow.yml).
+# Modules that need an optional extra (e.g. minima-llm) are imported from their
+# own module path, not re-exported here, so importing judges.shared stays cheap.
@@ -0,0 +1,77 @@
+"""
+Binary-decision request profile: short, constrained answers for yes/no style LLM calls.
+
+Judges that only read a "0" or "1" from the answer pay for every token a verbose
+model adds after it. The profile caps `max_tokens`, adds stop sequences, and asks
+for first-token logprobs, which `binary_probability` turns into a graded
+P(positive) where the endpoint returns them:
+
+    req = apply_binary_profile(req, {"max_tokens": 4, "logprobs": True})
+    ...
+    p = binary_probability(response.raw)   # None -> parse response.text as before
+
+Endpoints that ignore some of these parameters still work: without logprobs the
+caller falls back to parsing the text, and a missing cap only costs latency.
+Reasoning models (e.g. gpt-oss) spend output tokens before the answer, so give
+them a larger `max_tokens` than 1.
+"""
+
+import dataclasses
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+from minima_llm import MinimaLlmRequest
+
+BINARY_PROFILE_DEFAULTS: Dict[str, Any] = {
+    "max_tokens": 4,
+    "stop": ["\n"],
+    "logprobs": True,
+    "top_logprobs": 5,
+}
+
+
+def binary_profile(settings: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Merge workflow.yml settings over the defaults; None when the profile is off."""
+    if settings is None:
+        return None
+    unknown = set(settings) - set(BINARY_PROFILE_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown binary_decision setting(s): {sorted(unknown)}")
+    return {**BINARY_PROFILE_DEFAULTS, **settings}
+
+
+def apply_binary_profile(req: MinimaLlmRequest, profile: Optional[Dict[str, Any]]) -> MinimaLlmRequest:
+    """Copy of `req` with the profile's output cap, stop sequences and logprobs request."""
+    if profile is None:
+        return req
+    extra = dict(req.extra or {})
+    if profile.get("stop"):
+        extra["stop"] = list(profile["stop"])
+    if profile.get("logprobs"):
+        extra["logprobs"] = True
+        extra["top_logprobs"] = int(profile.get("top_logprobs") or 1)
+    return dataclasses.replace(req, max_tokens=profile.get("max_tokens"), extra=extra or None)
+
+
+def binary_probability(
+    raw: Optional[Dict[str, Any]],
+    positive: Iterable[str] = ("1",),
+    negative: Iterable[str] = ("0",),
+    scan_tokens: int = 3,
+) -> Optional[float]:
+    """P(positive) from the first answer token's top logprobs, renormalized over
+    the positive and negative candidates. Leading tokens without either candidate
+    (whitespace, a quote) are skipped, up to `scan_tokens`. None when the response
+    carries no usable logprobs."""
+    positive, negative = set(positive), set(negative)
+    try:
+        content: List[Dict[str, Any]] = raw["choices"][0]["logprobs"]["content"]  # type: ignore[index]
+    except (KeyError, IndexError, TypeError):
+        return None
+    for token_info in (content or [])[:scan_tokens]:
+        candidates = token_info.get("top_logprobs") or [token_info]
+        p_pos = sum(math.exp(c["logprob"]) for c in candidates if c.get("token", "").strip() in positive)
+        p_neg = sum(math.exp(c["logprob"]) for c in candidates if c.get("token", "").strip() in negative)
+        if p_pos + p_neg > 0:
+            return p_pos / (p_pos + p_neg)
+    return None
@@ -0,0 +1,175 @@
+"""
+Columnar leaderboard and qrels construction for judges that score in bulk.
+
+ColumnarLeaderboardBuilder adds a whole leaderboard's per-topic rows in one call.
+
+`LeaderboardBuilder.add` validates measure names and casts values row by row,
+which dominates the run time of cheap judges on large response sets. A judge
+that computes its measures as arrays hands them over column-wise instead:
+
+    builder = ColumnarLeaderboardBuilder(SPEC)
+    builder.add_columns(
+        run_ids=run_ids,
+        topic_ids=topic_ids,
+        columns={"LENGTH": lengths, "RANDOM": scores},   # lists or numpy arrays
+    )
+    leaderboard = builder.build()
+
+Names are validated once per call, and numeric columns are cast in bulk to
+the spec's dtype. The resulting entries are the same as those of
+per-row `add`, so `build`, `entries` and mixing both styles work as before.
+
+`count_words` is the bulk counterpart of `len(text.split())`.
+
+Qrels have the same problem: one record object per response, lambda
+accessors, and a dict for duplicate resolution. `build_qrels_columns` takes
+parallel topic_id / doc_id / grade arrays and resolves duplicates with a
+sort and group instead:
+
+    qrels = build_qrels_columns(topic_ids, doc_ids, grades, on_duplicate="keep_max")
+    write_qrels_columns(path, topic_ids, doc_ids, grades)   # TREC lines, no row objects
+
+Rows come out sorted by (topic_id, doc_id), the order `write_qrel_file`
+writes, so both paths produce the same qrels.txt as `build_qrels`.
+"""
+
+from pathlib import Path
+from typing import Any, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from autojudge_base import LeaderboardBuilder, LeaderboardEntry, MeasureSpec
+from autojudge_base.qrels.qrels import OnDuplicate, QrelRow, Qrels
+
+# str.split() whitespace within ASCII -> b" ", everything else -> b"a"
+_ASCII_WHITESPACE = b" \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+_WORD_TABLE = bytes(32 if i in _ASCII_WHITESPACE else 97 for i in range(256))
+
+
+class ColumnarLeaderboardBuilder(LeaderboardBuilder):
+    """LeaderboardBuilder with a column-wise `add_columns`."""
+
+    def add_columns(
+        self,
+        *,
+        run_ids: Sequence[str],
+        topic_ids: Sequence[str],
+        columns: Mapping[str, Sequence[Any]],
+    ) -> None:
+        """
+        Add one row per position: (run_ids[i], topic_ids[i], {measure: columns[measure][i]}).
+
+        As strict as `add`: unknown or missing measures raise KeyError, and
+        columns of the wrong length raise ValueError.
+        """
+        names = self.spec.name_set
+        extra = set(columns) - names
+        missing = names - set(columns)
+        if extra:
+            raise KeyError(f"Unknown measure(s): {sorted(extra)}")
+        if missing:
+            raise KeyError(f"Missing measure(s): {sorted(missing)}")
+
+        n = len(run_ids)
+        lengths = {"topic_ids": len(topic_ids), **{name: len(col) for name, col in columns.items()}}
+        wrong = {name: length for name, length in lengths.items() if length != n}
+        if wrong:
+            raise ValueError(f"Expected {n} values per column (len(run_ids)), got {wrong}")
+
+        measure_names = [ms.name for ms in self.spec.measures]
+        casted = [_cast_column(ms, columns[ms.name]) for ms in self.spec.measures]
+        # Bulk-append to the rows `add` appends to (pinned by tests/test_columnar.py); should
+        # autojudge-base ever stop keeping them in a `_rows` list, go through `add` instead.
+        rows = getattr(self, "_rows", None)
+        if not isinstance(rows, list):
+            for run_id, topic_id, *row in zip(run_ids, topic_ids, *casted):
+                self.add(run_id=run_id, topic_id=topic_id, values=dict(zip(measure_names, row)))
+            return
+        rows.extend(
+            LeaderboardEntry(run_id=run_id, topic_id=topic_id, values=dict(zip(measure_names, row)))
+            for run_id, topic_id, *row in zip(run_ids, topic_ids, *casted)
+        )
+
+
+def _cast_column(ms: MeasureSpec, column: Sequence[Any]) -> List[Any]:
+    """Column of Python values, as `ms.cast` would produce them one by one."""
+    if ms.dtype is float:
+        return np.asarray(column, dtype=np.float64).tolist()
+    if ms.dtype is int and isinstance(column, np.ndarray) and column.dtype.kind in "iu":
+        return column.astype(np.int64).tolist()
+    return [ms.cast(value) for value in column]
+
+
+def _count_words(text: str) -> int:
+    if not text.isascii():
+        return len(text.split())  # Unicode whitespace: let str.split decide
+    marks = text.encode("ascii").translate(_WORD_TABLE)
+    return marks.count(b" a") + marks.startswith(b"a")
+
+
+def count_words(texts: Sequence[str]) -> np.ndarray:
+    """`len(text.split())` for every text, without building the word lists."""
+    return np.fromiter(map(_count_words, texts), dtype=np.int64, count=len(texts))
+
+
+def _resolve_qrels_columns(
+    topic_ids: Sequence[str],
+    doc_ids: Sequence[str],
+    grades: Sequence[Any],
+    on_duplicate: OnDuplicate,
+) -> Tuple[List[str], List[str], List[int]]:
+    """Deduplicated (topic_ids, doc_ids, grades), sorted by (topic_id, doc_id)."""
+    n = len(topic_ids)
+    if len(doc_ids) != n or len(grades) != n:
+        raise ValueError(f"Column lengths differ: {n} topic_ids, {len(doc_ids)} doc_ids, {len(grades)} grades")
+    if on_duplicate not in ("error", "keep_max", "keep_last"):
+        raise ValueError(f"Unknown on_duplicate: {on_duplicate}")
+
+    # Integer codes in string order, so sorting codes sorts the strings
+    topics, topic_codes = np.unique(np.asarray(topic_ids, dtype=str), return_inverse=True)
+    docs, doc_codes = np.unique(np.asarray(doc_ids, dtype=str), return_inverse=True)
+    grade_values = np.asarray(grades).astype(np.int64)
+
+    # Within a (topic, doc) group the row to keep sorts last: highest grade, or latest position
+    tiebreak = grade_values if on_duplicate == "keep_max" else np.arange(n)
+    order = np.lexsort((tiebreak, doc_codes, topic_codes))
+    sorted_topics, sorted_docs = topic_codes[order], doc_codes[order]
+    last_of_group = np.ones(n, dtype=bool)
+    last_of_group[:-1] = (sorted_topics[1:] != sorted_topics[:-1]) | (sorted_docs[1:] != sorted_docs[:-1])
+
+    if on_duplicate == "error" and not last_of_group.all():
+        i = int(np.flatnonzero(~last_of_group)[0])
+        key = (str(topics[sorted_topics[i]]), str(docs[sorted_docs[i]]))
+        raise ValueError(f"Duplicate qrel for {key}: old={grade_values[order[i]]} new={grade_values[order[i + 1]]}")
+
+    keep = order[last_of_group]
+    return topics[topic_codes[keep]].tolist(), docs[doc_codes[keep]].tolist(), grade_values[keep].tolist()
+
+
+def build_qrels_columns(
+    topic_ids: Sequence[str],
+    doc_ids: Sequence[str],
+    grades: Sequence[Any],
+    on_duplicate: OnDuplicate = "keep_max",
+) -> Qrels:
+    """`build_qrels` over parallel columns; rows sorted by (topic_id, doc_id)."""
+    return Qrels(rows=[
+        QrelRow(topic_id=topic_id, doc_id=doc_id, grade=grade)
+        for topic_id, doc_id, grade in zip(*_resolve_qrels_columns(topic_ids, doc_ids, grades, on_duplicate))
+    ])
+
+
+def write_qrels_columns(
+    qrel_out_file: Union[str, Path],
+    topic_ids: Sequence[str],
+    doc_ids: Sequence[str],
+    grades: Sequence[Any],
+    on_duplicate: OnDuplicate = "keep_max",
+) -> int:
+    """Deduplicate and write TREC qrels lines (`topic 0 doc grade`) directly; returns the row count."""
+    topics, docs, values = _resolve_qrels_columns(topic_ids, doc_ids, grades, on_duplicate)
+    path = Path(qrel_out_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        f.writelines(f"{topic_id} 0 {doc_id} {grade}\n" for topic_id, doc_id, grade in zip(topics, docs, values))
+    return len(topics)
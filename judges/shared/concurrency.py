@@ -0,0 +1,152 @@
+"""
+AimdController: adaptive concurrency for LLM dispatch (additive increase, multiplicative decrease).
+
+`stream_generate(..., controller=...)` asks the controller how many requests may
+be in flight and reports every completed call back to it. Once per interval the
+controller looks at what completed since the last tick:
+
+- any throttling signal (HTTP 429/408/5xx failure) -> limit *= backoff
+- p95 latency above `target_p95_s`               -> limit *= backoff
+- p95 under target and the window was full       -> limit += increase
+
+so concurrency ramps up on a fast local endpoint and backs off when a shared
+one starts throttling. Each tick is kept in `trace` (and printed with
+`log=True`): per-second throughput, p95 latency, throttles and the new limit.
+
+Latency is measured around the whole call, so it includes the backend's own
+retries and cooldowns after a 429; the backend's `max_outstanding` remains a
+hard cap underneath the controller.
+
+Configure from workflow.yml with a settings dict, e.g.
+
+    adaptive_concurrency:
+      initial: 4
+      max_limit: 64
+      target_p95_s: 5.0
+"""
+
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from minima_llm import MinimaLlmFailure, MinimaLlmResult
+
+from judges.shared.metrics import percentile
+
+THROTTLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class AimdTick:
+    """One interval of the controller trace."""
+    t_s: float
+    completed: int
+    throughput: float
+    p95_s: Optional[float]
+    throttled: int
+    in_flight_peak: int
+    limit: int
+
+
+class AimdController:
+    """
+    AIMD concurrency limit driven by call latency and throttling.
+
+    `clock` is injectable so tests can drive ticks without sleeping.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        target_p95_s: float = 5.0,
+        increase: int = 1,
+        backoff: float = 0.5,
+        interval_s: float = 1.0,
+        log: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < backoff < 1:
+            raise ValueError(f"backoff must be in (0, 1), got {backoff}")
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.limit = min(self.max_limit, max(self.min_limit, int(initial)))
+        self.target_p95_s = float(target_p95_s)
+        self.increase = max(1, int(increase))
+        self.backoff = float(backoff)
+        self.interval_s = float(interval_s)
+        self.log = log
+        self.trace: List[AimdTick] = []
+
+        self._clock = clock
+        self._start = clock()
+        self._last_tick = self._start
+        self._latencies: List[float] = []
+        self._throttled = 0
+        self._in_flight = 0
+        self._in_flight_peak = 0
+
+    @classmethod
+    def from_dict(cls, settings: Dict[str, Any], **overrides: Any) -> "AimdController":
+        """Build from a workflow.yml settings dict; unknown keys raise ValueError."""
+        known = {"initial", "min_limit", "max_limit", "target_p95_s", "increase", "backoff", "interval_s", "log"}
+        unknown = set(settings) - known
+        if unknown:
+            raise ValueError(f"Unknown adaptive_concurrency setting(s): {sorted(unknown)}")
+        return cls(**{**settings, **overrides})
+
+    def note_in_flight(self, in_flight: int) -> None:
+        self._in_flight = in_flight
+        self._in_flight_peak = max(self._in_flight_peak, in_flight)
+
+    def observe(self, latency_s: float, result: MinimaLlmResult) -> None:
+        """Record one completed call."""
+        self._latencies.append(latency_s)
+        if isinstance(result, MinimaLlmFailure) and result.status in THROTTLE_STATUSES:
+            self._throttled += 1
+
+    def seconds_to_tick(self) -> float:
+        return max(0.0, self._last_tick + self.interval_s - self._clock())
+
+    def maybe_tick(self) -> None:
+        """Adjust the limit if an interval has passed since the last adjustment."""
+        now = self._clock()
+        if now - self._last_tick < self.interval_s:
+            return
+        elapsed = now - self._last_tick
+        p95 = percentile(self._latencies, 0.95)
+
+        if self._throttled or (p95 is not None and p95 > self.target_p95_s):
+            self.limit = max(self.min_limit, int(self.limit * self.backoff))
+        elif p95 is not None and self._in_flight_peak >= self.limit:
+            self.limit = min(self.max_limit, self.limit + self.increase)
+
+        tick = AimdTick(
+            t_s=round(now - self._start, 3),
+            completed=len(self._latencies),
+            throughput=len(self._latencies) / elapsed,
+            p95_s=p95,
+            throttled=self._throttled,
+            in_flight_peak=self._in_flight_peak,
+            limit=self.limit,
+        )
+        self.trace.append(tick)
+        if self.log:
+            p95_str = f"{p95:.2f}s" if p95 is not None else "-"
+            print(f"[aimd] t={tick.t_s:.0f}s {tick.throughput:.1f} req/s p95={p95_str} "
+                  f"throttled={tick.throttled} peak={tick.in_flight_peak} -> limit={tick.limit}")
+
+        self._last_tick = now
+        self._latencies = []
+        self._throttled = 0
+        self._in_flight_peak = self._in_flight
+
+    def write_trace(self, path: Union[str, Path]) -> None:
+        """Write the trace as TSV, one row per interval."""
+        names = [f.name for f in fields(AimdTick)]
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("\t".join(names) + "\n")
+            for tick in self.trace:
+                fh.write("\t".join("" if getattr(tick, n) is None else str(getattr(tick, n)) for n in names) + "\n")
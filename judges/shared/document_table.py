@@ -0,0 +1,247 @@
+"""
+DocumentTable: content-addressed SQLite sidecar for the cited documents of a run directory.
+
+Run JSONL files repeat the full `{"id", "text", "title", "url"}` payload of
+every cited passage under `documents`, in every response of every run.
+`dedup` rewrites a run directory so that each record keeps only references:
+
+    "documents": {"msmarco_v2.1_doc_00_0#1": {"id": ..., "text": ..., ...}, ...}
+      ->
+    "document_refs": {"msmarco_v2.1_doc_00_0#1": "<md5 of the document JSON>", ...}
+
+The documents themselves are stored once in a sidecar next to the run
+directory, `runs/generation/` -> `runs/generation.documents.sqlite`:
+
+    python -m judges.shared.document_table dedup runs/generation-full/ runs/generation/
+
+`load_runs` is the loader shim. It reads a deduplicated run directory and
+puts the documents back into `Report.documents`. A document shared by many
+responses is parsed once and the same `Document` object is used for all of
+them. Directories without a sidecar load like `load_runs_failsave`.
+`judges.shared.response_store` uses it for both `convert` and `run`.
+
+Plain `auto-judge run` ignores `document_refs`, so reports of a
+deduplicated directory arrive there with `documents=None`. That is enough
+for judges that never read documents. Judges that do read them need the
+shim: `python -m judges.shared.response_store run`.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import click
+
+from autojudge_base import Report
+from autojudge_base.document.document import Document
+
+DOCUMENT_REFS = "document_refs"
+DEFAULT_CACHE_ENTRIES = 100_000
+_IN_CHUNK = 500  # bound variables per SELECT ... IN (...)
+
+
+def document_hash(doc: Dict[str, Any]) -> str:
+    """md5 of the document's canonical JSON: equal content, equal id."""
+    canonical = json.dumps(doc, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.md5(canonical.encode("utf-8")).hexdigest()
+
+
+def sidecar_path(responses_dir: Union[str, Path]) -> Path:
+    """Default table of a run directory: a sibling `<dir>.documents.sqlite` (outside the run-file globs)."""
+    path = Path(responses_dir).absolute()
+    return path.parent / f"{path.name}.documents.sqlite"
+
+
+class DocumentTable:
+    """
+    SQLite table of documents keyed by `document_hash`.
+
+    Lookups go through a bounded LRU of parsed `Document`s
+    (`cache_entries`), since the same passages are cited over and over.
+    """
+
+    def __init__(self, db_path: Union[str, Path], cache_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_entries = max(0, int(cache_entries))
+        self._cache: "OrderedDict[str, Document]" = OrderedDict()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_hash TEXT PRIMARY KEY,
+                doc_json TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def __enter__(self) -> "DocumentTable":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def put_many(self, docs: Iterable[Dict[str, Any]]) -> List[str]:
+        """Store documents (existing content is kept as is); returns their hashes in order."""
+        rows = [(document_hash(doc), json.dumps(doc, ensure_ascii=False)) for doc in docs]
+        self._conn.executemany("INSERT OR IGNORE INTO documents (doc_hash, doc_json) VALUES (?, ?)", rows)
+        return [doc_hash for doc_hash, _ in rows]
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, Document]:
+        """Documents by hash; raises KeyError for hashes not in the table."""
+        found: Dict[str, Document] = {}
+        missing: List[str] = []
+        for doc_hash in dict.fromkeys(hashes):
+            doc = self._cache.get(doc_hash)
+            if doc is None:
+                missing.append(doc_hash)
+            else:
+                self._cache.move_to_end(doc_hash)
+                found[doc_hash] = doc
+
+        for doc_hash, doc_json in self.get_json_many(missing).items():
+            found[doc_hash] = self._remember(doc_hash, Document.model_validate_json(doc_json))
+        return found
+
+    def get_json_many(self, hashes: Iterable[str]) -> Dict[str, str]:
+        """Stored JSON by hash, bypassing the cache; raises KeyError for hashes not in the table."""
+        wanted = list(dict.fromkeys(hashes))
+        found: Dict[str, str] = {}
+        for start in range(0, len(wanted), _IN_CHUNK):
+            chunk = wanted[start:start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self._conn.execute(
+                f"SELECT doc_hash, doc_json FROM documents WHERE doc_hash IN ({placeholders})", chunk
+            ))
+
+        absent = [doc_hash for doc_hash in wanted if doc_hash not in found]
+        if absent:
+            raise KeyError(f"{self.db_path}: {len(absent)} document(s) not in table, e.g. {absent[0]}")
+        return found
+
+    def _remember(self, doc_hash: str, doc: Document) -> Document:
+        if self.cache_entries:
+            self._cache[doc_hash] = doc
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return doc
+
+    def dedup_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Move `record["documents"]` into the table, leaving `document_refs` (in place)."""
+        docs = record.pop("documents", None)
+        if docs is not None:
+            record[DOCUMENT_REFS] = dict(zip(docs.keys(), self.put_many(docs.values())))
+        return record
+
+    def resolve_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Inverse of `dedup_record`: `document_refs` -> `documents` (in place)."""
+        refs = record.pop(DOCUMENT_REFS, None)
+        if refs is not None:
+            docs = self.get_many(refs.values())
+            record["documents"] = {key: docs[doc_hash] for key, doc_hash in refs.items()}
+        return record
+
+
+@dataclass
+class DedupStats:
+    files: int
+    reports: int
+    documents: int          # document references written as refs
+    unique_documents: int   # rows in the table afterwards
+
+
+def dedup(
+    runs_dir: Union[str, Path],
+    out_dir: Union[str, Path],
+    table_path: Optional[Union[str, Path]] = None,
+) -> DedupStats:
+    """Rewrite the run files under `runs_dir` into `out_dir` with `document_refs`, filling the table."""
+    from judges.shared.response_store import run_files
+
+    runs_dir, out_dir = Path(runs_dir).absolute(), Path(out_dir).absolute()
+    table_path = Path(table_path) if table_path else sidecar_path(out_dir)
+    files = reports = references = 0
+    with DocumentTable(table_path, cache_entries=0) as table:
+        for source in run_files(runs_dir):
+            target = out_dir / source.relative_to(runs_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with source.open(encoding="utf-8") as f, target.open("w", encoding="utf-8") as out:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = table.dedup_record(json.loads(line))
+                    references += len(record.get(DOCUMENT_REFS) or ())
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    reports += 1
+            table.commit()
+            files += 1
+        unique = len(table)
+    return DedupStats(files=files, reports=reports, documents=references, unique_documents=unique)
+
+
+def load_runs(
+    responses_dir: Union[str, Path],
+    table_path: Optional[Union[str, Path]] = None,
+) -> List[Report]:
+    """`load_runs_failsave` that resolves `document_refs` from the directory's document table."""
+    table_path = Path(table_path) if table_path else sidecar_path(responses_dir)
+    if not table_path.is_file():
+        from autojudge_base.io import load_runs_failsave
+        return load_runs_failsave(Path(responses_dir))
+
+    from judges.shared.response_store import run_files
+
+    reports: List[Report] = []
+    with DocumentTable(table_path) as table:
+        for source in run_files(responses_dir):
+            with source.open(encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    report = Report.model_validate(table.resolve_record(json.loads(line)))
+                    report.path = source
+                    reports.append(report)
+    return reports
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+@click.group()
+def main() -> None:
+    """Deduplicate cited documents into a content-addressed sidecar table."""
+
+
+@main.command("dedup")
+@click.argument("runs_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("out_dir", type=click.Path(path_type=Path))
+@click.option("--table", "table_path", type=click.Path(path_type=Path), default=None,
+              help="Document table (default: <OUT_DIR>.documents.sqlite next to OUT_DIR).")
+def dedup_cmd(runs_dir: Path, out_dir: Path, table_path: Optional[Path]) -> None:
+    """Rewrite the run files under RUNS_DIR into OUT_DIR, citing documents by hash."""
+    if out_dir.absolute() == runs_dir.absolute():
+        raise click.UsageError("OUT_DIR must differ from RUNS_DIR")
+    stats = dedup(runs_dir, out_dir, table_path)
+    click.echo(
+        f"{out_dir}: {stats.files} files, {stats.reports} reports, "
+        f"{stats.unique_documents} unique of {stats.documents} documents",
+        err=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+LeaderboardJournal: append-only checkpoint of per-(run, topic) leaderboard values.
+
+A long judging pass writes one JSONL line per scored (run_id, topic_id) as soon
+as its values are known, to `{filebase}.journal.jsonl` next to
+`{filebase}.eval.txt`. Each line is flushed immediately, so a crash loses at most
+the line being written:
+
+    {"run_id": "run1", "topic_id": "leaf", "values": {"FIRST_SENTENCE_RELEVANT": 1}, "fingerprint": "9f2c..."}
+
+Reopening the journal with the same filebase resumes it: existing lines are
+loaded (a torn last line is dropped), and the judge asks `recall()` for each
+(run, topic) before doing the work, or calls `replay()` to add everything at
+once. `fingerprint` is optional; when a judge records one (e.g. a hash of the
+prompt), an entry is only reused if the fingerprint still matches, so edited
+responses or changed settings are re-judged instead of silently replayed.
+
+Usage in a judge:
+
+    builder = LeaderboardBuilder(SPEC)
+    with LeaderboardJournal(filebase) as journal:
+        for report in rag_responses:
+            key = (report.metadata.run_id, report.metadata.topic_id)
+            values = journal.recall(*key)
+            if values is None:
+                values = score(report)
+                journal.append(*key, values)
+            builder.add(run_id=key[0], topic_id=key[1], values=values)
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from autojudge_base import LeaderboardBuilder
+
+
+def journal_file_path(filebase: Union[str, Path]) -> Path:
+    """Resolve the journal path: {filebase}.journal.jsonl"""
+    filebase = Path(filebase)
+    return filebase.parent / f"{filebase.name}.journal.jsonl"
+
+
+class LeaderboardJournal:
+    """
+    Append-only JSONL journal of leaderboard rows; use as a context manager.
+
+    With `resume=False` an existing journal is discarded and judging starts over.
+    """
+
+    def __init__(self, filebase: Union[str, Path], resume: bool = True):
+        self.path = journal_file_path(filebase)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # (run_id, topic_id) -> (fingerprint, values); later lines win
+        self.entries: Dict[Tuple[str, str], Tuple[Optional[str], Dict[str, Any]]] = {}
+        self.written = 0
+        self.recalled = 0
+
+        if resume and self.path.exists():
+            self._load()
+            self._fh = open(self.path, "a", encoding="utf-8")
+        else:
+            self._fh = open(self.path, "w", encoding="utf-8")
+
+    def _load(self) -> None:
+        raw = self.path.read_bytes()
+        complete = raw[: raw.rfind(b"\n") + 1]  # drop a line torn by a crash
+        if len(complete) != len(raw):
+            with open(self.path, "r+b") as fh:
+                fh.truncate(len(complete))
+        for line in complete.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            self.entries[(row["run_id"], row["topic_id"])] = (row.get("fingerprint"), row["values"])
+
+    def recall(self, run_id: str, topic_id: str, fingerprint: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Values journaled for (run_id, topic_id) under the same fingerprint, else None."""
+        entry = self.entries.get((run_id, topic_id))
+        if entry is None or entry[0] != fingerprint:
+            return None
+        self.recalled += 1
+        return entry[1]
+
+    def replay(self, builder: LeaderboardBuilder) -> int:
+        """Add every journaled row to `builder` (fingerprints unchecked); returns the count."""
+        for (run_id, topic_id), (_, values) in self.entries.items():
+            builder.add(run_id=run_id, topic_id=topic_id, values=values)
+        self.recalled += len(self.entries)
+        return len(self.entries)
+
+    def append(self, run_id: str, topic_id: str, values: Dict[str, Any], fingerprint: Optional[str] = None) -> None:
+        row: Dict[str, Any] = {"run_id": run_id, "topic_id": topic_id, "values": values}
+        if fingerprint is not None:
+            row["fingerprint"] = fingerprint
+        self._fh.write(json.dumps(row) + "\n")
+        self._fh.flush()
+        self.entries[(run_id, topic_id)] = (fingerprint, values)
+        self.written += 1
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "LeaderboardJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,88 @@
+"""
+Streaming LLM dispatch: a bounded window of requests in flight, results as they complete.
+
+`OpenAIMinimaLlm.run_batched` needs the whole request list up front and returns
+only when the last call finished. `stream_generate` instead pulls requests lazily
+from any iterable, keeps at most `window` of them in flight, and yields each
+result as soon as it arrives, so a judge can fold results into its leaderboard
+(and checkpoint them) while the rest is still running. Memory stays bounded by
+the window, not by the size of the response set.
+
+With an `AimdController`, the window is adaptive: the controller's current
+limit replaces `window`, and every completed call reports its latency and
+outcome back to it.
+
+Requires the minima-llm extra: uv pip install -e '.[minima-llm]'
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Iterable, Optional, Set, Tuple, TypeVar
+
+from minima_llm import MinimaLlmRequest, MinimaLlmResult, OpenAIMinimaLlm
+
+from .concurrency import AimdController
+from .metrics import RunMetrics
+from .response_memo import ResponseMemo
+
+T = TypeVar("T")
+
+
+async def stream_generate(
+    backend: OpenAIMinimaLlm,
+    items: Iterable[Tuple[T, MinimaLlmRequest]],
+    window: int = 64,
+    memo: Optional[ResponseMemo] = None,
+    controller: Optional[AimdController] = None,
+    metrics: Optional[RunMetrics] = None,
+) -> AsyncIterator[Tuple[T, MinimaLlmResult]]:
+    """Yield (tag, result) for each (tag, request) in `items`, in completion order.
+
+    `tag` is whatever the caller needs to place the result (e.g. run_id, topic_id).
+    With `memo`, requests go through `ResponseMemo.generate` (memo hits and
+    in-flight dedup); otherwise straight to `backend.generate`. With `metrics`,
+    every result and its latency is recorded via `RunMetrics.record_llm`.
+    """
+    window = max(1, int(window))
+
+    def limit() -> int:
+        return controller.limit if controller is not None else window
+
+    async def one(tag: T, req: MinimaLlmRequest) -> Tuple[T, MinimaLlmResult]:
+        started = time.monotonic()
+        if memo is not None:
+            result = await memo.generate(backend, req)
+        else:
+            result = await backend.generate(req)
+        latency = time.monotonic() - started
+        if metrics is not None:
+            metrics.record_llm(result, latency)
+        if controller is not None and not getattr(result, "cached", False):  # cache hits say nothing about load
+            controller.observe(latency, result)
+        return tag, result
+
+    in_flight: Set["asyncio.Task[Tuple[T, MinimaLlmResult]]"] = set()
+
+    async def wait_some() -> Set["asyncio.Task[Tuple[T, MinimaLlmResult]]"]:
+        nonlocal in_flight
+        # With a controller, wake up at least once per interval so it can adjust the limit
+        timeout = controller.seconds_to_tick() if controller is not None else None
+        done, in_flight = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if controller is not None:
+            controller.maybe_tick()
+        return done
+
+    try:
+        for tag, req in items:
+            while len(in_flight) >= limit():
+                for task in await wait_some():
+                    yield task.result()
+            in_flight.add(asyncio.create_task(one(tag, req)))
+            if controller is not None:
+                controller.note_in_flight(len(in_flight))
+        while in_flight:
+            for task in await wait_some():
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,122 @@
+"""
+RunMetrics: opt-in timing, counter and histogram instrumentation for judge runs.
+
+    metrics = RunMetrics()
+    with metrics.phase("judge"):
+        for report in rag_responses:
+            ...
+            metrics.count("responses")
+    metrics.write(filebase)            # -> {filebase}.metrics.json
+
+Phases accumulate wall-clock seconds (re-entering a phase adds to it),
+counters are plain integers, and histograms keep their samples until `write`,
+which reduces them to count / mean / p50 / p95 / max. `record_llm` folds one
+LLM result into the standard counters (calls, cache hits, failures, retries,
+input/output tokens) and, when the latency is known, the `llm_latency_s`
+histogram. It duck-types on the minima-llm result fields, so this module needs
+no LLM dependency and non-LLM judges can use it too.
+
+`run_all_datasets.py` reads these files back (`read_metrics`) for its summary.
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+
+def metrics_file_path(filebase: Union[str, Path]) -> Path:
+    """Resolve the metrics path: {filebase}.metrics.json"""
+    filebase = Path(filebase)
+    return filebase.parent / f"{filebase.name}.metrics.json"
+
+
+class RunMetrics:
+    """Phase timers, counters and histograms for one judge run."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, List[float]] = {}
+        self._start = time.monotonic()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.monotonic() - started
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, value: float) -> None:
+        self.histograms.setdefault(name, []).append(value)
+
+    def record_llm(self, result: Any, latency_s: Optional[float] = None) -> None:
+        """Count one MinimaLlmResponse / MinimaLlmFailure."""
+        self.count("llm_results")
+        if getattr(result, "cached", False):  # memo/cache hit or collapsed duplicate: no call, no tokens
+            self.count("cache_hits")
+        elif hasattr(result, "text"):
+            self.count("llm_calls")
+            self.count("input_tokens", getattr(result, "input_tokens", 0) or 0)
+            self.count("output_tokens", getattr(result, "output_tokens", 0) or 0)
+            if latency_s is not None:
+                self.observe("llm_latency_s", latency_s)
+        else:
+            self.count("llm_failures")
+            self.count("retries", max(0, (getattr(result, "attempts", 1) or 1) - 1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_s": round(time.monotonic() - self._start, 3),
+            "phases_s": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+            "counters": dict(self.counters),
+            "histograms": {name: summarize(values) for name, values in self.histograms.items()},
+        }
+
+    def write(self, filebase: Union[str, Path]) -> Path:
+        path = metrics_file_path(filebase)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+
+def percentile(values: Sequence[float], q: float, presorted: bool = False) -> Optional[float]:
+    """Nearest-rank `q` percentile (0 < q <= 1) of the samples; None if there are none."""
+    if not values:
+        return None
+    ordered = values if presorted else sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """count / mean / p50 / p95 / max of a histogram's samples."""
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 6),
+        "p50": round(percentile(ordered, 0.50, presorted=True), 6),
+        "p95": round(percentile(ordered, 0.95, presorted=True), 6),
+        "max": round(ordered[-1], 6),
+    }
+
+
+def read_metrics(directory: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Sum wall time and counters over every *.metrics.json in `directory`; None if there are none."""
+    files = sorted(Path(directory).glob("*.metrics.json"))
+    if not files:
+        return None
+    total: Dict[str, Any] = {"files": len(files), "wall_s": 0.0, "counters": {}}
+    for path in files:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        total["wall_s"] += data.get("wall_s", 0.0)
+        for name, value in data.get("counters", {}).items():
+            total["counters"][name] = total["counters"].get(name, 0) + value
+    return total
@@ -0,0 +1,54 @@
+"""
+Per-topic nugget summaries, built once per judge call.
+
+Judges that only need counts, question ids or gold answers of a topic's
+nugget bank should not walk the bank (`nuggets_as_list()`, nested
+question -> answers dicts) for every response. Build the index once at the
+start of `judge` and look topics up in it:
+
+    index = build_nugget_index(nugget_banks)      # {} when nugget_banks is None
+    summary = index.get(topic_id)                 # None: no bank for this topic
+    if summary and summary.count:
+        ...
+    summary.answers[question_id]                  # frozenset of gold answer texts
+
+Works for `NuggetBanks` (questions and claims) and `NuggetizerNuggetBanks`
+(plain nuggets, which have no question ids or answers).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from autojudge_base import NuggetBanksProtocol
+
+
+@dataclass(frozen=True)
+class NuggetSummary:
+    """What scoring usually needs from one topic's nugget bank."""
+    topic_id: str
+    count: int  # questions + claims (NuggetBank) or nuggets (Nuggetizer)
+    question_ids: Tuple[str, ...] = ()
+    answers: Mapping[str, FrozenSet[str]] = field(default_factory=dict)  # question_id -> gold answers
+
+
+def summarize_bank(topic_id: str, bank: Any) -> NuggetSummary:
+    """Summary of a single topic's bank."""
+    if hasattr(bank, "nuggets"):  # NuggetizerNuggetBank
+        return NuggetSummary(topic_id=topic_id, count=len(bank.nuggets))
+
+    questions = list((bank.nugget_bank or {}).values())
+    claims = bank.claim_bank or {}
+    answers = {q.question_id: frozenset(q.answers or ()) for q in questions}
+    return NuggetSummary(
+        topic_id=topic_id,
+        count=len(questions) + len(claims),
+        question_ids=tuple(q.question_id for q in questions),
+        answers=answers,
+    )
+
+
+def build_nugget_index(nugget_banks: Optional[NuggetBanksProtocol]) -> Dict[str, NuggetSummary]:
+    """One NuggetSummary per topic with a bank; empty when there are no nugget banks."""
+    if not nugget_banks:
+        return {}
+    return {topic_id: summarize_bank(topic_id, bank) for topic_id, bank in nugget_banks.banks.items()}
@@ -0,0 +1,106 @@
+"""
+Share nugget/qrels artifacts between the configurations of one `auto-judge run`.
+
+`auto-judge run --sweep grid-search` runs every phase for every grid point,
+even when a grid point only changes `judge_settings` and the upstream nuggets
+and qrels would be identical. Decorating a phase method with `@shared_phase`
+keys its result on what the phase actually consumes:
+
+- the phase's explicit keyword parameters (its settings; values passed only
+  through **kwargs are ignored, since the phase does not read them),
+- the identity of the responses, the topic ids, and the identity of the
+  upstream nugget banks / qrels objects it receives.
+
+A repeated call with the same key returns the earlier result instead of
+recomputing it. Cached artifacts are passed on unchanged, so a qrels phase fed
+a reused nugget bank also hits its own cache. A 3 x 3 grid over
+`questions_per_topic` x `keyword_bonus` then creates nuggets 3 times
+instead of 9:
+
+    class MyNuggetCreator:
+        @shared_phase
+        def create_nuggets(self, rag_responses, rag_topics, llm_config, nugget_banks=None,
+                           questions_per_topic: int = 3, filebase="default", outdir=Path("."), **kwargs):
+            ...
+
+The runner still writes each configuration's output files. Entries hold
+references to the inputs they were computed from, so object ids cannot be
+reused while an entry is alive. Only the last `DEFAULT_MAX_ENTRIES` results
+are kept. Set `phase_cache: false` in workflow.yml settings to recompute
+every phase.
+"""
+
+import functools
+import inspect
+import json
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAX_ENTRIES = 16
+
+# Protocol parameters that are data or output paths, not settings
+_DATA_PARAMS = ("rag_responses", "rag_topics", "nugget_banks", "qrels")
+_IGNORED_PARAMS = {"self", "llm_config", "filebase", "outdir"}
+
+_cache: "OrderedDict[Hashable, Tuple[Any, List[Any]]]" = OrderedDict()
+hits: Dict[str, int] = {}
+
+
+def _settings_key(arguments: Dict[str, Any], setting_names: List[str]) -> str:
+    return json.dumps({name: arguments[name] for name in setting_names}, sort_keys=True, default=repr)
+
+
+def shared_phase(method: F) -> F:
+    """Reuse the method's result for repeated calls with the same consumed settings and inputs."""
+    signature = inspect.signature(method)
+    setting_names = [
+        name for name, param in signature.parameters.items()
+        if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+        and name not in _IGNORED_PARAMS and name not in _DATA_PARAMS and name != "corpus"
+    ]
+    phase = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        if not kwargs.get("phase_cache", True):
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if arguments.get("rag_responses") is not None and not isinstance(arguments["rag_responses"], list):
+            arguments["rag_responses"] = list(arguments["rag_responses"])  # iterate twice: key and phase
+        responses = arguments.get("rag_responses") or []
+        topics = arguments.get("rag_topics") or []
+
+        inputs: List[Any] = [responses, arguments.get("nugget_banks"), arguments.get("qrels")]
+        key = (
+            phase,
+            _settings_key(arguments, setting_names),
+            repr(arguments.get("corpus")),
+            tuple(id(r) for r in responses),
+            tuple(t.request_id for t in topics),
+            id(inputs[1]),
+            id(inputs[2]),
+        )
+        if key in _cache:
+            _cache.move_to_end(key)
+            hits[phase] = hits.get(phase, 0) + 1
+            print(f"[phase_cache] {phase}: reusing result for identical settings and inputs", file=sys.stderr)
+            return _cache[key][0]
+
+        result = method(*bound.args, **bound.kwargs)
+        _cache[key] = (result, inputs)  # keep inputs alive so their ids stay unique
+        while len(_cache) > DEFAULT_MAX_ENTRIES:
+            _cache.popitem(last=False)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def clear() -> None:
+    _cache.clear()
+    hits.clear()
@@ -0,0 +1,110 @@
+"""
+ReportTextMemo: per-(run_id, topic_id) memo of report text, lowercased text and md5 doc_id.
+
+The phases of one `auto-judge run` (create_qrels, judge, and every variant or
+sweep configuration) see the same Reports. Each phase would otherwise join
+the report text again with `get_report_text()`, lowercase it, and hash it for
+qrels doc ids. The memo computes each of these at most once per report:
+
+    memo = report_text_memo(enabled=report_memo, max_entries=report_memo_max_entries)
+    text = memo.text(report)
+    lower = memo.lower(report)
+    doc_id = memo.doc_id(report)          # == doc_id_md5(report.get_report_text())
+
+`report_text_memo(enabled=True)` returns one process-wide memo, so the phases
+share it. `enabled=False` returns a pass-through that stores nothing.
+Memory is bounded: the least recently used entries are dropped beyond
+`max_entries`.
+
+Entries are keyed by (run_id, topic_id) and remember which Report object they
+were computed from. A different Report under the same key replaces the
+entry, for example another dataset in the same process.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from autojudge_base import Report
+from autojudge_base.qrels.qrels import doc_id_md5
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+
+class _Entry:
+    __slots__ = ("report", "text", "lower", "doc_id")
+
+    def __init__(self, report: Report, text: str):
+        self.report = report
+        self.text = text
+        self.lower: Optional[str] = None
+        self.doc_id: Optional[str] = None
+
+
+class ReportTextMemo:
+    """Bounded LRU memo of derived report strings; `max_entries=0` disables storing."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, report: Report) -> _Entry:
+        key = (report.metadata.run_id, report.metadata.topic_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry.report is report:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = _Entry(report, report.get_report_text())
+        if self.max_entries:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def text(self, report: Report) -> str:
+        return self._entry(report).text
+
+    def lower(self, report: Report) -> str:
+        entry = self._entry(report)
+        if entry.lower is None:
+            entry.lower = entry.text.lower()
+        return entry.lower
+
+    def doc_id(self, report: Report) -> str:
+        entry = self._entry(report)
+        if entry.doc_id is None:
+            entry.doc_id = doc_id_md5(entry.text)
+        return entry.doc_id
+
+    def resize(self, max_entries: int) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_shared: Optional[ReportTextMemo] = None
+
+
+def report_text_memo(enabled: bool = True, max_entries: int = DEFAULT_MAX_ENTRIES) -> ReportTextMemo:
+    """The process-wide memo when enabled (resized to `max_entries`), else a pass-through."""
+    global _shared
+    if not enabled:
+        return ReportTextMemo(max_entries=0)
+    if _shared is None:
+        _shared = ReportTextMemo(max_entries)
+    elif _shared.max_entries != max_entries:
+        _shared.resize(max_entries)
+    return _shared
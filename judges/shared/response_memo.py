@@ -0,0 +1,234 @@
+"""
+ResponseMemo: judge-level memo of LLM responses, shared across runs and variants.
+
+Requests are keyed on a canonical hash of (model, messages, temperature, and
+max_tokens/extra when set) and stored in an SQLite file with the same layout as
+the minima-llm prompt cache (`key, response_text, response_raw, created_at`;
+the raw response JSON keeps logprobs across a memo hit). Before a batch is dispatched, requests
+with the same key are collapsed to one call and memo hits are answered
+locally, so repeated boilerplate and sweep variants that re-judge the same
+text cost nothing, independent of the backend's own caching. `generate` is
+the one-request form for streaming callers: a request whose twin is still
+in flight waits for that answer instead of being sent again.
+
+Only dispatched requests come back as fresh results. Memo hits carry
+`cached=True, cache_source="memo"`, and collapsed duplicates carry
+`cached=True, cache_source="duplicate"` (failures: `attempts=0`), so
+`RunMetrics.record_llm` counts each call and its tokens once.
+
+Requires the minima-llm extra: uv pip install -e '.[minima-llm]'
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from minima_llm import MinimaLlmFailure, MinimaLlmRequest, MinimaLlmResponse, MinimaLlmResult, OpenAIMinimaLlm
+
+
+def as_duplicate(result: MinimaLlmResult, request_id: str) -> MinimaLlmResult:
+    """A twin's result re-addressed to `request_id`, marked as not dispatched."""
+    if isinstance(result, MinimaLlmResponse):
+        return dataclasses.replace(result, request_id=request_id, cached=True, cache_source="duplicate")
+    return dataclasses.replace(result, request_id=request_id, attempts=0)
+
+
+class ResponseMemo:
+    """
+    SQLite-backed memo in front of `OpenAIMinimaLlm.run_batched`.
+
+    With `db_path=None` nothing is stored: requests are only deduplicated
+    against twins in the same batch or still in flight, so memory stays bounded
+    by the batch or streaming window. Eviction (`max_entries` keeps the newest
+    rows, `max_age_days` drops older rows) runs when the memo is opened and closed.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        *,
+        max_entries: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+    ):
+        self.db_path = str(db_path) if db_path else None
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self.duplicates = 0
+        self._inflight: Dict[str, "asyncio.Future[MinimaLlmResult]"] = {}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if not self.db_path:
+            return
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                response_text TEXT NOT NULL,
+                response_raw TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+        # Memo files written before raw responses were kept, or that kept them as `raw_json`
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+        if "raw_json" in columns and "response_raw" not in columns:
+            self._conn.execute("ALTER TABLE cache RENAME COLUMN raw_json TO response_raw")
+        elif "response_raw" not in columns:
+            self._conn.execute("ALTER TABLE cache ADD COLUMN response_raw TEXT")
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def key(req: MinimaLlmRequest, model: str) -> str:
+        """Canonical hash of what determines the answer: model, messages, temperature,
+        and max_tokens/extra when set (so keys of plain requests are unchanged)."""
+        obj: Dict[str, Any] = {"model": req.model or model, "messages": req.messages, "temperature": req.temperature}
+        if req.max_tokens is not None:
+            obj["max_tokens"] = req.max_tokens
+        if req.extra:
+            obj["extra"] = req.extra
+        canonical = json.dumps(obj, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute("SELECT response_text FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def get_response(self, key: str, request_id: str) -> Optional[MinimaLlmResponse]:
+        """Memo hit as a cached MinimaLlmResponse (with `raw` when it was kept), else None."""
+        if self._conn is None:
+            return None
+        row = self._conn.execute("SELECT response_text, response_raw FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        raw = json.loads(row[1]) if row[1] else None
+        return MinimaLlmResponse(request_id=request_id, text=row[0], raw=raw, cached=True, cache_source="memo")
+
+    def put_many(self, rows: Dict[str, Union[str, MinimaLlmResponse]]) -> None:
+        """Store answers: plain text, or responses (text plus raw JSON). No-op without a db_path."""
+        if self._conn is None:
+            return
+        now = time.time()
+        values = []
+        for key, answer in rows.items():
+            if isinstance(answer, MinimaLlmResponse):
+                raw = json.dumps(answer.raw) if answer.raw is not None else None
+                values.append((key, answer.text, now, raw))
+            else:
+                values.append((key, answer, now, None))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO cache (key, response_text, created_at, response_raw) VALUES (?, ?, ?, ?)",
+            values,
+        )
+        self._conn.commit()
+
+    async def run_batched(
+        self,
+        backend: OpenAIMinimaLlm,
+        requests: List[MinimaLlmRequest],
+    ) -> List[MinimaLlmResult]:
+        """Drop-in for `backend.run_batched(requests)`: results come back in request order,
+        each carrying its own request_id, but only unique memo misses reach the backend."""
+        keys: List[str] = [self.key(req, backend.cfg.model) for req in requests]
+
+        answered: Dict[str, MinimaLlmResult] = {}
+        pending: Dict[str, MinimaLlmRequest] = {}  # one representative request per missing key
+        for key, req in zip(keys, requests):
+            if key in answered or key in pending:
+                self.duplicates += 1
+                continue
+            hit = self.get_response(key, req.request_id)
+            if hit is not None:
+                answered[key] = hit
+                self.hits += 1
+            else:
+                pending[key] = req
+                self.misses += 1
+
+        if pending:
+            fresh = await backend.run_batched(list(pending.values()))
+            answered.update(zip(pending.keys(), fresh))
+            # Failures are never memoized, so the next run retries them
+            self.put_many({key: r for key, r in zip(pending.keys(), fresh) if isinstance(r, MinimaLlmResponse)})
+
+        results: List[MinimaLlmResult] = []
+        seen: set = set()
+        for key, req in zip(keys, requests):
+            result = answered[key]
+            if key in seen:
+                result = as_duplicate(result, req.request_id)
+            elif result.request_id != req.request_id:
+                result = dataclasses.replace(result, request_id=req.request_id)
+            seen.add(key)
+            results.append(result)
+        return results
+
+    async def generate(self, backend: OpenAIMinimaLlm, req: MinimaLlmRequest) -> MinimaLlmResult:
+        """Drop-in for `backend.generate(req)` with the same memo and dedup as `run_batched`."""
+        key = self.key(req, backend.cfg.model)
+        twin = self._inflight.get(key)
+        if twin is not None:
+            self.duplicates += 1
+            return as_duplicate(await asyncio.shield(twin), req.request_id)
+        hit = self.get_response(key, req.request_id)
+        if hit is not None:
+            self.hits += 1
+            return hit
+
+        self.misses += 1
+        future: "asyncio.Future[MinimaLlmResult]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await backend.generate(req)
+        except Exception as e:  # transport errors become failures, as in run_batched
+            if isinstance(e, (NameError, TypeError, AttributeError, SyntaxError, ImportError)):
+                future.cancel()
+                raise
+            result = MinimaLlmFailure(request_id=req.request_id, error_type=type(e).__name__,
+                                      message=str(e), attempts=1)
+        except BaseException:
+            future.cancel()  # twins waiting on this call are cancelled with it
+            raise
+        finally:
+            del self._inflight[key]
+        if isinstance(result, MinimaLlmResponse):
+            self.put_many({key: result})
+        future.set_result(result)
+        return result
+
+    def evict(self) -> int:
+        """Apply the age and size limits; returns the number of rows removed."""
+        if self._conn is None:
+            return 0
+        removed = 0
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400.0
+            removed += self._conn.execute("DELETE FROM cache WHERE created_at < ?", (cutoff,)).rowcount
+        if self.max_entries is not None:
+            removed += self._conn.execute(
+                "DELETE FROM cache WHERE key NOT IN "
+                "(SELECT key FROM cache ORDER BY created_at DESC LIMIT ?)",
+                (max(0, int(self.max_entries)),),
+            ).rowcount
+        self._conn.commit()
+        return removed
+
+    def summary(self) -> str:
+        total = self.hits + self.misses + self.duplicates
+        return (f"{total} requests: {self.hits} memo hits, {self.misses} misses dispatched, "
+                f"{self.duplicates} duplicates collapsed")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.evict()
+            self._conn.close()
@@ -0,0 +1,358 @@
+"""
+ResponseStore: memory-mapped, indexed run responses with a deduplicated documents table.
+
+`--rag-responses runs/` parses every run JSONL line into a Report, including
+its `documents` dict of cited passage text, and keeps all of it in memory.
+Most judges never read `documents`. On rag25-sized run directories the
+documents are most of the bytes, and the same passages repeat across runs
+and topics.
+
+`convert` writes the run directory once into a store directory:
+
+    responses.jsonl   one line per report, without `documents`
+    documents.jsonl   one line per distinct document
+    index.json        per report: metadata, source path, byte offset/length,
+                      and document key -> documents.jsonl line
+
+`ResponseStore` memory-maps both data files and answers from the index.
+`reports(run_ids=..., topic_ids=...)` looks the matching records up by
+(run_id, topic_id) and reads only those. It returns `LazyReport`s, which
+parse their line into a Report on first use beyond `metadata`.
+`documents=False` leaves `documents` out entirely.
+
+    python -m judges.shared.response_store convert data/kiddie/runs/repgen/ /tmp/repgen.store
+    python -m judges.shared.response_store run --workflow judges/naive/workflow.yml \\
+        --rag-responses /tmp/repgen.store --rag-topics data/kiddie/topics/kiddie-topics.jsonl \\
+        --run run1 --topic leaf --skip-documents --out-dir ./output/
+
+`run` is `auto-judge run` with a store-aware `--rag-responses`: a store
+directory is opened lazily and `--run`/`--topic` seek straight to their
+records. A plain run directory is loaded as before.
+"""
+
+import json
+import mmap
+from dataclasses import dataclass
+from glob import glob
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import click
+
+from autojudge_base import Report
+from autojudge_base.report import ReportMetaData
+
+STORE_VERSION = 1
+INDEX_FILE = "index.json"
+RESPONSES_FILE = "responses.jsonl"
+DOCUMENTS_FILE = "documents.jsonl"
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def run_files(runs_dir: Union[str, Path]) -> List[Path]:
+    """The files `load_runs_failsave` reads from a run directory, in the same order."""
+    path = Path(runs_dir).absolute()
+    globs = sorted(glob(f"{path}/*") + glob(f"{path}/*/*") + glob(f"{path}/*/*/*"))
+    return [Path(f) for f in globs if Path(f).is_file()]
+
+
+@dataclass
+class StoreStats:
+    reports: int
+    documents: int          # document references in the runs
+    unique_documents: int   # rows in documents.jsonl
+
+
+def convert(
+    runs_dir: Union[str, Path],
+    store_dir: Union[str, Path],
+    document_table: Optional[Union[str, Path]] = None,
+) -> StoreStats:
+    """Write the runs under `runs_dir` into a response store at `store_dir`.
+
+    Records with `document_refs` (see judges.shared.document_table) take
+    their documents from `document_table`, by default the run directory's
+    sidecar.
+    """
+    from judges.shared.document_table import DOCUMENT_REFS, DocumentTable, document_hash, sidecar_path
+
+    table_path = Path(document_table) if document_table else sidecar_path(runs_dir)
+    table = DocumentTable(table_path, cache_entries=0) if table_path.is_file() else None
+    store = Path(store_dir)
+    store.mkdir(parents=True, exist_ok=True)
+    records: List[Dict[str, Any]] = []
+    doc_numbers: Dict[str, int] = {}    # document_hash -> documents.jsonl line; texts stay on disk
+    doc_spans: List[Tuple[int, int]] = []
+    references = 0
+
+    with (store / RESPONSES_FILE).open("wb") as responses, (store / DOCUMENTS_FILE).open("wb") as documents:
+        for source in run_files(runs_dir):
+            with source.open(encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue    # tolerate blank/trailing lines, like load_report
+                    data = json.loads(line)
+                    docs = data.pop("documents", None)
+                    refs_in = data.pop(DOCUMENT_REFS, None)
+                    hashed: Optional[Dict[str, str]] = None     # key -> document_hash
+                    stored: Dict[str, str] = {}
+                    if refs_in is not None and table is not None:
+                        hashed, docs = refs_in, None
+                    elif docs is not None:
+                        hashed = {key: document_hash(doc) for key, doc in docs.items()}
+
+                    refs: Optional[Dict[str, int]] = None
+                    if hashed is not None:
+                        if docs is None:    # only fetch what is not in the store yet
+                            stored = table.get_json_many(h for h in hashed.values() if h not in doc_numbers)
+                        refs = {}
+                        for key, doc_hash in hashed.items():
+                            number = doc_numbers.get(doc_hash)
+                            if number is None:
+                                blob = _dumps(docs[key] if docs is not None else json.loads(stored[doc_hash]))
+                                number = doc_numbers[doc_hash] = len(doc_spans)
+                                doc_spans.append((documents.tell(), len(blob)))
+                                documents.write(blob + b"\n")
+                            refs[key] = number
+                            references += 1
+
+                    blob = _dumps(data)
+                    records.append({
+                        "metadata": data["metadata"],
+                        "path": str(source),
+                        "offset": responses.tell(),
+                        "length": len(blob),
+                        "documents": refs,
+                    })
+                    responses.write(blob + b"\n")
+
+    if table is not None:
+        table.close()
+    index = {"version": STORE_VERSION, "records": records, "documents": doc_spans}
+    (store / INDEX_FILE).write_text(json.dumps(index), encoding="utf-8")
+    return StoreStats(reports=len(records), documents=references, unique_documents=len(doc_spans))
+
+
+def is_store(path: Union[str, Path]) -> bool:
+    return (Path(path) / INDEX_FILE).is_file()
+
+
+def _map(path: Path) -> Union[mmap.mmap, bytes]:
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return b""      # mmap cannot map an empty file
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ResponseStore:
+    """Read side of a store written by `convert`."""
+
+    def __init__(self, store_dir: Union[str, Path]):
+        self.path = Path(store_dir)
+        index = json.loads((self.path / INDEX_FILE).read_text(encoding="utf-8"))
+        if index.get("version") != STORE_VERSION:
+            raise ValueError(f"{self.path}: unsupported response store version {index.get('version')!r}")
+        self._records: List[Dict[str, Any]] = index["records"]
+        self._doc_spans: List[Tuple[int, int]] = index["documents"]
+        self._responses = _map(self.path / RESPONSES_FILE)
+        self._documents = _map(self.path / DOCUMENTS_FILE)
+
+        self._by_key: Dict[Tuple[str, str], List[int]] = {}
+        self._by_run: Dict[str, List[int]] = {}
+        self._by_topic: Dict[str, List[int]] = {}
+        for i, record in enumerate(self._records):
+            run_id, topic_id = record["metadata"]["run_id"], record["metadata"]["topic_id"]
+            self._by_key.setdefault((run_id, topic_id), []).append(i)
+            self._by_run.setdefault(run_id, []).append(i)
+            self._by_topic.setdefault(topic_id, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def run_ids(self) -> List[str]:
+        return list(self._by_run)
+
+    @property
+    def topic_ids(self) -> List[str]:
+        return list(self._by_topic)
+
+    def _select(self, run_ids: Optional[Sequence[str]], topic_ids: Optional[Sequence[str]]) -> List[int]:
+        if run_ids and topic_ids:
+            found = [i for run_id in set(run_ids) for topic_id in set(topic_ids) for i in self._by_key.get((run_id, topic_id), ())]
+        elif run_ids:
+            found = [i for run_id in set(run_ids) for i in self._by_run.get(run_id, ())]
+        elif topic_ids:
+            found = [i for topic_id in set(topic_ids) for i in self._by_topic.get(topic_id, ())]
+        else:
+            return list(range(len(self._records)))
+        return sorted(found)   # store order == load_runs_failsave order
+
+    def reports(
+        self,
+        run_ids: Optional[Sequence[str]] = None,
+        topic_ids: Optional[Sequence[str]] = None,
+        documents: bool = True,
+    ) -> List["LazyReport"]:
+        """Lazy reports of the given runs/topics (all if None), in run-file order."""
+        return [LazyReport(self, i, documents) for i in self._select(run_ids, topic_ids)]
+
+    def _load(self, i: int, documents: bool) -> Dict[str, Any]:
+        record = self._records[i]
+        offset = record["offset"]
+        data = json.loads(self._responses[offset:offset + record["length"]])
+        if documents and record["documents"] is not None:
+            data["documents"] = {key: self._document(number) for key, number in record["documents"].items()}
+        return data
+
+    def _document(self, number: int) -> Dict[str, Any]:
+        offset, length = self._doc_spans[number]
+        return json.loads(self._documents[offset:offset + length])
+
+
+class LazyReport:
+    """
+    A Report that is parsed on first use.
+
+    `metadata` comes from the store index. Any other attribute parses the
+    record into a real `Report` (see `materialize`) and is forwarded to it.
+    """
+
+    __slots__ = ("_store", "_index", "_documents", "_metadata", "_report")
+
+    def __init__(self, store: ResponseStore, index: int, documents: bool = True):
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_documents", documents)
+        object.__setattr__(self, "_metadata", None)
+        object.__setattr__(self, "_report", None)
+
+    @property
+    def metadata(self) -> ReportMetaData:
+        if self._report is not None:
+            return self._report.metadata
+        if self._metadata is None:
+            object.__setattr__(self, "_metadata", ReportMetaData.model_validate(self._store._records[self._index]["metadata"]))
+        return self._metadata
+
+    def materialize(self) -> Report:
+        if self._report is None:
+            data = self._store._load(self._index, self._documents)
+            if self._metadata is not None:
+                data["metadata"] = self._metadata   # keep the object callers already hold
+            report = Report.model_validate(data)
+            report.path = Path(self._store._records[self._index]["path"])
+            object.__setattr__(self, "_report", report)
+        return self._report
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyReport.__slots__:
+            raise AttributeError(name)  # unset slot (e.g. during copy), not a Report field
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.materialize(), name, value)
+
+    def __repr__(self) -> str:
+        metadata = self.metadata
+        return f"LazyReport(run_id={metadata.run_id!r}, topic_id={metadata.topic_id!r})"
+
+
+def load_responses(
+    path: Union[str, Path],
+    run_ids: Optional[Sequence[str]] = None,
+    topic_ids: Optional[Sequence[str]] = None,
+    documents: bool = True,
+) -> Iterable[Union[Report, LazyReport]]:
+    """Reports from a response store (lazy, seeking) or a plain run directory (parsed, then filtered).
+
+    A plain run directory written by `document_table.dedup` gets its documents
+    back from its sidecar table.
+    """
+    if is_store(path):
+        return ResponseStore(path).reports(run_ids=run_ids, topic_ids=topic_ids, documents=documents)
+
+    from judges.shared.document_table import load_runs
+
+    reports = load_runs(path)
+    if run_ids:
+        reports = [r for r in reports if r.metadata.run_id in set(run_ids)]
+    if topic_ids:
+        reports = [r for r in reports if r.metadata.topic_id in set(topic_ids)]
+    if not documents:
+        for r in reports:
+            r.documents = None
+    return reports
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+@click.group()
+def main() -> None:
+    """Build and use memory-mapped response stores."""
+
+
+@main.command("convert")
+@click.argument("runs_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("store_dir", type=click.Path(path_type=Path))
+def convert_cmd(runs_dir: Path, store_dir: Path) -> None:
+    """Convert the run files under RUNS_DIR into a response store at STORE_DIR."""
+    stats = convert(runs_dir, store_dir)
+    click.echo(
+        f"{store_dir}: {stats.reports} reports, {stats.unique_documents} unique of {stats.documents} documents",
+        err=True,
+    )
+
+
+class _StoreOrRunDir(click.ParamType):
+    """`--rag-responses` that keeps a store directory unopened until --run/--topic are known."""
+    name = "dir"
+
+    def convert(self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]) -> Any:
+        path = Path(value).expanduser() if value else None
+        if not path or not path.is_dir():
+            self.fail(f"The directory {value} does not exist, so I can not load rag responses from this directory.", param, ctx)
+        return path
+
+
+def _run_command() -> click.Command:
+    """`auto-judge run`, with store-aware --rag-responses and --skip-documents."""
+    from autojudge_base._commands._run import run_workflow
+
+    params = []
+    for param in run_workflow.params:
+        if param.name == "rag_responses":
+            param = click.Option(
+                ["--rag-responses"], type=_StoreOrRunDir(), required=True,
+                help="Run directory, or response store written by `convert`.",
+            )
+        params.append(param)
+    params.append(click.Option(
+        ["--skip-documents"], is_flag=True, default=False,
+        help="Do not load the cited `documents` of each report.",
+    ))
+
+    def callback(rag_responses: Path, skip_documents: bool, **kwargs: Any) -> None:
+        responses = list(load_responses(
+            rag_responses,
+            run_ids=kwargs.get("run_ids"),
+            topic_ids=kwargs.get("topic_ids"),
+            documents=not skip_documents,
+        ))
+        if not responses:
+            raise click.UsageError(f"{str(rag_responses)!r} contains no rag runs for the selected --run/--topic.")
+        run_workflow.callback(rag_responses=responses, **kwargs)
+
+    return click.Command("run", params=params, callback=callback, help=run_workflow.help)
+
+
+main.add_command(_run_command())
+
+
+if __name__ == "__main__":
+    main()
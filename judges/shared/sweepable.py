@@ -0,0 +1,77 @@
+"""
+Sweepable judge parameters: compute features once, emit one leaderboard per grid point.
+
+A judge lists the parameters that only enter its final scoring step:
+
+    class MyJudge:
+        sweepable_params = ("keyword_bonus",)
+
+and accepts either a scalar or a list for them. A sweep that passes the list
+straight through to the judge, e.g. in workflow.yml
+
+    sweeps:
+      keyword-sweep:
+        judge_settings:
+          keyword_bonus: [0.1, 0.2, 0.3, 0.4]
+
+then costs one pass over the responses. The judge extracts the
+parameter-independent features once, scores every grid point from them (for
+example with numpy broadcasting), and writes each point's leaderboard with
+`write_point_leaderboard`:
+
+    points = sweep_grid({"keyword_bonus": keyword_bonus}, self.sweepable_params)
+    for point, leaderboard in zip(points[1:], leaderboards[1:]):
+        write_point_leaderboard(leaderboard, point_filebase(sweep_filebase, filebase, point), rag_topics)
+    return leaderboards[0]
+
+The runner always writes the returned leaderboard to `{filebase}.eval.txt`,
+so that file is the first grid point and the judge writes only the others.
+Writing the first point under its own name too would put the same
+leaderboard in two `*.eval.txt` files. For keyword_bonus [0.1, 0.2, 0.3]:
+
+    complete_example.eval.txt        keyword_bonus 0.1
+    complete_example-b0.2.eval.txt
+    complete_example-b0.3.eval.txt
+
+Each point file is written exactly as the runner writes `{filebase}.eval.txt`
+(ir_measures format plus `.eval.measures.yml`), so it matches a per-variant
+run of that point.
+"""
+
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+from autojudge_base import Leaderboard, Request
+from autojudge_base.workflow.paths import resolve_leaderboard_file_path
+
+
+def sweep_grid(params: Dict[str, Any], sweepable: Sequence[str]) -> List[Dict[str, Any]]:
+    """Cartesian product over the sweepable params; a scalar is a one-value axis. Order follows the lists."""
+    names = [name for name in sweepable if name in params]
+    axes = [params[name] if isinstance(params[name], (list, tuple)) else [params[name]] for name in names]
+    for name, axis in zip(names, axes):
+        if not axis:
+            raise ValueError(f"Sweepable parameter {name!r} has no values")
+    return [dict(zip(names, values)) for values in product(*axes)]
+
+
+def point_filebase(template: str, filebase: Union[str, Path], point: Dict[str, Any]) -> Path:
+    """Filebase of one grid point, e.g. "{filebase}-b{keyword_bonus}" -> .../complete_example-b0.1"""
+    filebase = Path(filebase)
+    return filebase.parent / template.format(filebase=filebase.name, **point)
+
+
+def write_point_leaderboard(
+    leaderboard: Leaderboard,
+    filebase: Union[str, Path],
+    rag_topics: Sequence[Request],
+    leaderboard_format: str = "ir_measures",
+) -> Path:
+    """Verify and write one grid point's leaderboard like the runner does: {filebase}.eval.txt (+ measures.yml)."""
+    path = resolve_leaderboard_file_path(Path(filebase))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    leaderboard.verify(expected_topic_ids=[t.request_id for t in rag_topics], on_missing="fix_aggregate")
+    leaderboard.write(path, format=leaderboard_format)
+    leaderboard.spec.write_measures_yaml(path.with_suffix(".measures.yml"))
+    return path
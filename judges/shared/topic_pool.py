@@ -0,0 +1,61 @@
+"""
+Topic-sharded execution for judges whose per-topic work is independent.
+
+A judge groups its responses by topic, builds one picklable task per topic,
+and hands a module-level scoring function to `map_topics`. The function may
+return anything picklable; the complete example returns one feature row per
+response:
+
+    def topic_features(task) -> List[Tuple[str, float, bool]]:   # [(run_id, base_score, has_keywords), ...]
+        ...
+
+    tasks = {topic_id: make_task(topic_id, reports) for topic_id, reports in group_by_topic(rag_responses).items()}
+    for topic_id, rows in map_topics(topic_features, tasks, workers=topic_workers).items():
+        ...
+
+With `workers <= 1` the tasks run in-process; otherwise they fan out over a
+process pool. Results come back in task order either way, so the leaderboard
+is identical for any worker count. Topics without responses get no task;
+`LeaderboardBuilder.build(expected_topic_ids=..., on_missing=...)` handles
+them as before.
+
+Judges that need an expensive per-process resource (e.g. a started JVM for
+PyTerrier) pass an `initializer` that warms it once per worker, and must not
+start it in the parent process before the pool forks.
+"""
+
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from autojudge_base import Report
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def group_by_topic(rag_responses: Iterable[Report]) -> Dict[str, List[Report]]:
+    """Reports per topic_id, in first-seen topic order and response order within a topic."""
+    grouped: Dict[str, List[Report]] = defaultdict(list)
+    for report in rag_responses:
+        grouped[report.metadata.topic_id].append(report)
+    return dict(grouped)
+
+
+def map_topics(
+    score_topic: Callable[[T], R],
+    tasks: Dict[str, T],
+    workers: int = 1,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Sequence[Any] = (),
+) -> Dict[str, R]:
+    """Run `score_topic` on every task, in-process or on `workers` processes; results keep task order."""
+    if workers <= 1 or len(tasks) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return {topic_id: score_topic(task) for topic_id, task in tasks.items()}
+
+    workers = min(workers, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=tuple(initargs)) as pool:
+        return dict(zip(tasks.keys(), pool.map(score_topic, tasks.values(), chunksize=chunksize)))
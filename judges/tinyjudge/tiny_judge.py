@@ -7,8 +7,10 @@ This is the simplest possible LLM judge - use it as a starting point.
 """
 
 import asyncio
+import json
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
 
 from autojudge_base import (
     Leaderboard,
@@ -21,13 +23,46 @@ from autojudge_base import (
     Report,
     Request,
 )
-from minima_llm import MinimaLlmConfig, MinimaLlmRequest, MinimaLlmResponse, OpenAIMinimaLlm
+from minima_llm import MinimaLlmConfig, MinimaLlmRequest, MinimaLlmResponse, MinimaLlmResult, OpenAIMinimaLlm
+
+from judges.shared.binary_decision import apply_binary_profile, binary_probability, binary_profile
+from judges.shared.concurrency import AimdController
+from judges.shared.journal import LeaderboardJournal
+from judges.shared.llm_stream import stream_generate
+from judges.shared.metrics import RunMetrics
+from judges.shared.prompt_prefix import estimate_prefix_savings, prefix_sorted, prefix_sorted_chunks, sorted_chunks
+from judges.shared.response_memo import ResponseMemo
 
 
 TINY_SPEC = LeaderboardSpec(measures=(
     MeasureSpec("FIRST_SENTENCE_RELEVANT", description="LLM judgment of first sentence relevance (0.0-1.0)"),
 ))
 
+# Static parts first, judged text last, so requests for one topic share a cacheable prefix
+SYSTEM_PROMPT = "You are a relevance evaluator. Respond with only 1 or 0."
+USER_PROMPT = "Is this relevant to the query?\n\nQuery: {query}\nText: {text}"
+
+# items_per_call > 1: several texts for one query, answered as a JSON list
+PACKED_SYSTEM_PROMPT = (
+    "You are a relevance evaluator. For each numbered text, decide whether it is relevant to the query. "
+    "Respond with only a JSON list of 1 or 0, one value per text, in order."
+)
+PACKED_USER_PROMPT = "Are these texts relevant to the query?\n\nQuery: {query}\n\n{texts}\n\nAnswer with a JSON list of {count} values."
+
+# stream_window: 0 sends requests in batches of this many calls per backend slot (max_outstanding)
+BATCH_CALLS_PER_SLOT = 4
+
+T = TypeVar("T")
+
+
+class _Item(NamedTuple):
+    """One response to judge, with the fingerprint its judgment is journaled under."""
+    run_id: str
+    topic_id: str
+    query: str
+    text: str
+    fingerprint: str
+
 
 class TinyJudge:
     """
@@ -48,58 +83,306 @@ class TinyJudge:
         filebase: str = "default",
         outdir: Path = Path("."),
         segments: int = 1,
+        memo_db: Optional[str] = None,
+        memo_max_entries: Optional[int] = None,
+        memo_max_age_days: Optional[float] = None,
+        stream_window: int = 0,
+        resume: bool = True,
+        prefix_order: bool = True,
+        prefix_lookahead: int = 1024,
+        items_per_call: int = 1,
+        adaptive_concurrency: Optional[Dict[str, Any]] = None,
+        binary_decision: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Leaderboard:
         """Judge first-response-segment relevance using LLM (batched for efficiency).
 
         `segments` (from workflow settings) controls how many leading response
         segments are sent to the LLM; the default of 1 judges only the first.
+
+        Identical prompts are sent once per batch (when streaming: once while a
+        twin is in flight); nothing is kept beyond that, so memory stays bounded.
+        `memo_db` additionally keeps answers in an SQLite file across runs and
+        variants, bounded by `memo_max_entries` and/or `memo_max_age_days`.
+
+        With `stream_window: N`, responses are read lazily and at most N requests
+        are in flight; each result is added to the leaderboard as it completes and
+        checkpointed to `{filebase}.journal.jsonl`. The default (0) sends requests
+        in batches of `BATCH_CALLS_PER_SLOT` x the backend's `max_outstanding`;
+        each batch is journaled as soon as it returns.
+
+        With `resume` (default), a journal left by an earlier run with the same
+        filebase is replayed: (run, topic) pairs judged under an identical prompt
+        are taken from it and only the missing pairs are sent to the LLM.
+        Failed calls are not journaled, so they are retried.
+
+        With `prefix_order` (default), requests are sent sorted by prompt, so all
+        requests for one topic go out back-to-back and a server-side prefix cache
+        can reuse the shared system prompt and query. In batch mode all responses
+        are sorted before dispatching. When streaming (`stream_window` > 0 or
+        `adaptive_concurrency`), responses are sorted `prefix_lookahead` at a time,
+        so memory stays bounded; topics spread further apart than that share less.
+
+        With `items_per_call: N` > 1, up to N responses for the same topic are
+        packed into one call that answers with a JSON list of 0/1 values. Calls
+        whose answer is malformed (not a list of N values) are retried one
+        response per call. The leaderboard has the same shape either way, and
+        journal entries are interchangeable between the two modes.
+
+        `adaptive_concurrency` (a dict of `AimdController` settings) replaces the
+        fixed dispatch parallelism with an AIMD controller: concurrency grows while
+        p95 latency stays under `target_p95_s` and halves on 429/5xx responses.
+        Its per-second trace is written to `{filebase}.concurrency.tsv`.
+
+        `binary_decision` (a dict, see `judges.shared.binary_decision`) caps the
+        answer length of single-item calls, adds stop sequences and requests
+        first-token logprobs; where the endpoint returns them, the measure becomes
+        the graded probability of "1" instead of 0/1.
+
+        Timing, token and cache counts are written to `{filebase}.metrics.json`.
         """
+        metrics = RunMetrics()
         topic_titles: Dict[str, str] = {t.request_id: t.title or "" for t in rag_topics}
         expected_topic_ids: List[str] = list(topic_titles.keys())
 
-        # Collect all requests with metadata
-        requests_info: List[Tuple[str, str, MinimaLlmRequest]] = []  # (run_id, topic_id, request)
-        for i, response in enumerate(rag_responses):
-            query = topic_titles.get(response.metadata.topic_id, "")
-            judged_text = " ".join(r.text for r in response.responses[:segments] if r.text)
-            requests_info.append((
-                response.metadata.run_id,
-                response.metadata.topic_id,
-                MinimaLlmRequest(
-                    request_id=f"q{i}",
-                    messages=[
-                        {"role": "system", "content": "You are a relevance evaluator. Respond with only 1 or 0."},
-                        {"role": "user", "content": f"Is this relevant to the query?\n\nQuery: {query}\nText: {judged_text}"},
-                    ],
-                    temperature=0.0,
-                ),
-            ))
-
-        # Run all LLM requests in batch
         # Convert base config to full MinimaLlmConfig for backend features (batching, retry, etc.)
         full_config = MinimaLlmConfig.from_dict(llm_config.raw) if llm_config.raw else MinimaLlmConfig.from_env()
         backend = OpenAIMinimaLlm(full_config)
-        llm_results = asyncio.run(backend.run_batched([req for _, _, req in requests_info]))
-
-        # Build leaderboard from responses
+        memo = ResponseMemo(memo_db, max_entries=memo_max_entries, max_age_days=memo_max_age_days)
         builder = LeaderboardBuilder(TINY_SPEC)
-        for (run_id, topic_id, _), result in zip(requests_info, llm_results):
-            relevance = self._parse_relevance(result)
-            builder.add(run_id=run_id, topic_id=topic_id, values={"FIRST_SENTENCE_RELEVANT": relevance})
+        journal = LeaderboardJournal(filebase, resume=resume)
+        profile = binary_profile(binary_decision)
+        controller: Optional[AimdController] = None
+        if adaptive_concurrency is not None:
+            # The backend's max_outstanding semaphore caps real concurrency underneath the controller
+            settings = dict(adaptive_concurrency)
+            settings["max_limit"] = min(settings.get("max_limit", full_config.max_outstanding), full_config.max_outstanding)
+            controller = AimdController.from_dict(settings)
+
+        # Responses still to be judged, produced lazily. Pairs already in the journal
+        # under the same single-item prompt are replayed instead.
+        def missing_items() -> Iterator[Tuple[_Item, MinimaLlmRequest]]:
+            for i, response in enumerate(rag_responses):
+                metrics.count("responses")
+                run_id, topic_id = response.metadata.run_id, response.metadata.topic_id
+                query = topic_titles.get(topic_id, "")
+                judged_text = " ".join(r.text for r in response.responses[:segments] if r.text)
+                req = self._single_request(f"q{i}", query, judged_text, profile)
+                fingerprint = ResponseMemo.key(req, full_config.model)
+                values = journal.recall(run_id, topic_id, fingerprint)
+                if values is not None:
+                    builder.add(run_id=run_id, topic_id=topic_id, values=values)
+                else:
+                    yield _Item(run_id, topic_id, query, judged_text, fingerprint), req
+
+        items: Iterable[Tuple[_Item, MinimaLlmRequest]] = missing_items()
+        streaming = stream_window > 0 or controller is not None
+        if prefix_order or items_per_call > 1:
+            if streaming:
+                # Bounded look-ahead keeps streaming lazy
+                items = (prefix_sorted_chunks(items, prefix_lookahead) if prefix_order
+                         else sorted_chunks(items, prefix_lookahead, key=lambda item: item[0].topic_id))
+            else:
+                with metrics.phase("prepare"):
+                    arrival = list(items)
+                    items = prefix_sorted(arrival) if prefix_order else sorted(arrival, key=lambda item: item[0].topic_id)
+                if prefix_order:
+                    print(f"[TinyJudge] Prefix cache, arrival order: {estimate_prefix_savings(r for _, r in arrival)}")
 
-        return builder.build(expected_topic_ids=expected_topic_ids, on_missing="fix_aggregate")
+        try:
+            # Lazily produced items are read during this phase too
+            with metrics.phase("dispatch"):
+                asyncio.run(self._judge_items(backend, memo, items, items_per_call, stream_window, controller,
+                                              prefix_order and not streaming, profile, builder, journal, metrics))
+        finally:
+            journal.close()
+            memo.close()
+            if controller is not None and controller.trace:
+                controller.write_trace(f"{filebase}.concurrency.tsv")
+        if journal.recalled:
+            print(f"[TinyJudge] Resumed {journal.recalled} judgments from {journal.path}")
+        print(f"[TinyJudge] {memo.summary()}")
 
-    def _parse_relevance(self, result: Any) -> int:
-        """Parse LLM response to relevance score (0 or 1)."""
+        with metrics.phase("build"):
+            leaderboard = builder.build(expected_topic_ids=expected_topic_ids, on_missing="fix_aggregate")
+        metrics.count("resumed", journal.recalled)
+        metrics.count("memo_hits", memo.hits)
+        metrics.count("memo_duplicates", memo.duplicates)
+        metrics.write(filebase)
+        return leaderboard
+
+    async def _judge_items(
+        self,
+        backend: OpenAIMinimaLlm,
+        memo: ResponseMemo,
+        items: Iterable[Tuple[_Item, MinimaLlmRequest]],
+        items_per_call: int,
+        window: int,
+        controller: Optional[AimdController],
+        report_prefix: bool,
+        profile: Optional[Dict[str, Any]],
+        builder: LeaderboardBuilder,
+        journal: LeaderboardJournal,
+        metrics: RunMetrics,
+    ) -> None:
+        """Judge `items` one per call, or packed `items_per_call` per topic with single-call fallback.
+
+        `report_prefix` prints the prefix-cache estimate of the dispatch order, which
+        needs all requests at once (batch mode only)."""
+        if items_per_call <= 1:
+            if report_prefix:
+                items = list(items)
+                print(f"[TinyJudge] Prefix cache, sorted order: {estimate_prefix_savings(r for _, r in items)}")
+            async for item, result in self._dispatch(backend, memo, items, window, controller, metrics):
+                self._record(builder, journal, item, self._parse_relevance(result), result)
+            return
+
+        # Pack consecutive items of the same topic (items arrive grouped by topic), lazily
+        packed_calls = 0
+
+        def pack() -> Iterator[Tuple[Tuple[_Item, ...], MinimaLlmRequest]]:
+            nonlocal packed_calls
+            for _, group in groupby(items, key=lambda item: item[0].topic_id):
+                group_items = [item for item, _ in group]
+                for start in range(0, len(group_items), items_per_call):
+                    chunk = tuple(group_items[start:start + items_per_call])
+                    yield chunk, self._packed_request(f"p{packed_calls}", chunk)
+                    packed_calls += 1
+
+        packed: Iterable[Tuple[Tuple[_Item, ...], MinimaLlmRequest]] = pack()
+        if report_prefix:
+            packed = list(packed)
+            print(f"[TinyJudge] Prefix cache, packed order: {estimate_prefix_savings(r for _, r in packed)}")
+
+        fallback: List[Tuple[_Item, MinimaLlmRequest]] = []
+        async for chunk, result in self._dispatch(backend, memo, packed, window, controller, metrics):
+            relevances = self._parse_relevance_list(result, len(chunk))
+            if relevances is None:
+                for item in chunk:
+                    fallback.append((item, self._single_request(f"f{len(fallback)}", item.query, item.text, profile)))
+                continue
+            for item, relevance in zip(chunk, relevances):
+                self._record(builder, journal, item, relevance, result)
+
+        metrics.count("packed_calls", packed_calls)
+        metrics.count("fallback_items", len(fallback))
+        if fallback:
+            print(f"[TinyJudge] {len(fallback)} items had no usable packed answer, judging them one per call")
+            async for item, result in self._dispatch(backend, memo, fallback, window, controller, metrics):
+                self._record(builder, journal, item, self._parse_relevance(result), result)
+
+    async def _dispatch(
+        self,
+        backend: OpenAIMinimaLlm,
+        memo: ResponseMemo,
+        requests: Iterable[Tuple[T, MinimaLlmRequest]],
+        window: int,
+        controller: Optional[AimdController],
+        metrics: RunMetrics,
+    ) -> AsyncIterator[Tuple[T, MinimaLlmResult]]:
+        """Yield (tag, result): streamed with at most `window` in flight (or as many as
+        `controller` allows), or batch by batch when window is 0 and there is no controller."""
+        if window > 0 or controller is not None:
+            if controller is not None:
+                print(f"[TinyJudge] Adaptive concurrency: starting at {controller.limit}, "
+                      f"range {controller.min_limit}-{controller.max_limit}, target p95 {controller.target_p95_s}s")
+            else:
+                print(f"[TinyJudge] Streaming with at most {window} requests in flight")
+            done = 0
+            async for tag, result in stream_generate(backend, requests, window=window, memo=memo,
+                                                      controller=controller, metrics=metrics):
+                yield tag, result
+                done += 1
+                if done % 500 == 0:
+                    print(f"[TinyJudge] {done} calls completed")
+        else:
+            # Bounded batches, so an interrupted pass keeps every batch that already returned
+            batch_size = max(1, backend.cfg.max_outstanding) * BATCH_CALLS_PER_SLOT
+            pending = iter(requests)
+            while True:
+                batch = list(islice(pending, batch_size))
+                if not batch:
+                    break
+                results = await memo.run_batched(backend, [req for _, req in batch])
+                for (tag, _), result in zip(batch, results):
+                    metrics.record_llm(result)  # per-call latency is not visible through run_batched
+                    yield tag, result
+
+    @staticmethod
+    def _single_request(request_id: str, query: str, text: str, profile: Optional[Dict[str, Any]]) -> MinimaLlmRequest:
+        return apply_binary_profile(MinimaLlmRequest(
+            request_id=request_id,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": USER_PROMPT.format(query=query, text=text)},
+            ],
+            temperature=0.0,
+        ), profile)
+
+    @staticmethod
+    def _packed_request(request_id: str, chunk: Sequence[_Item]) -> MinimaLlmRequest:
+        texts = "\n".join(f"Text {j}: {item.text}" for j, item in enumerate(chunk, start=1))
+        return MinimaLlmRequest(
+            request_id=request_id,
+            messages=[
+                {"role": "system", "content": PACKED_SYSTEM_PROMPT},
+                {"role": "user", "content": PACKED_USER_PROMPT.format(query=chunk[0].query, count=len(chunk), texts=texts)},
+            ],
+            temperature=0.0,
+        )
+
+    def _record(
+        self,
+        builder: LeaderboardBuilder,
+        journal: LeaderboardJournal,
+        item: _Item,
+        relevance: float,
+        result: Any,
+    ) -> None:
+        """Add one judgment to the leaderboard; only successful calls are journaled, so failures are retried on resume."""
+        values = {"FIRST_SENTENCE_RELEVANT": relevance}
+        builder.add(run_id=item.run_id, topic_id=item.topic_id, values=values)
+        if isinstance(result, MinimaLlmResponse):
+            journal.append(item.run_id, item.topic_id, values, item.fingerprint)
+
+    def _parse_relevance(self, result: Any) -> float:
+        """Parse LLM response to relevance: P("1") from logprobs when present, else 0 or 1 from the text."""
         if not isinstance(result, MinimaLlmResponse):
             print(f"[TinyJudge] LLM error: {result}")
             return 0
 
+        probability = binary_probability(result.raw)
+        if probability is not None:
+            return probability
+
         text = result.text.strip().lower()
         # Check negative indicators first (order matters: "not relevant" contains "relevant")
         if text.startswith("0") or "not relevant" in text or text == "no":
             return 0
         if text.startswith("1") or "relevant" in text or text == "yes":
             return 1
-        return 0
\ No newline at end of file
+        return 0
+
+    def _parse_relevance_list(self, result: Any, count: int) -> Optional[List[int]]:
+        """Parse a packed answer: a JSON list of `count` values, each 0 or 1. None if unusable."""
+        if not isinstance(result, MinimaLlmResponse):
+            print(f"[TinyJudge] LLM error: {result}")
+            return None
+        # Tolerate prose or code fences around the list
+        text = result.text
+        start, end = text.find("["), text.rfind("]")
+        if start < 0 or end < start:
+            return None
+        try:
+            values = json.loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(values, list) or len(values) != count:
+            return None
+        relevances: List[int] = []
+        for value in values:
+            if value in (0, 1, "0", "1"):  # also matches False/True
+                relevances.append(int(value))
+            else:
+                return None
+        return relevances
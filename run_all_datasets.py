@@ -7,18 +7,28 @@ Usage:
     python run_all_datasets.py --workflow judges/naive/workflow.yml --datasets my_datasets.yml
     python run_all_datasets.py --workflow judges/naive/workflow.yml --runs prio1
     python run_all_datasets.py --workflow judges/naive/workflow.yml --topics assessed
+    python run_all_datasets.py --workflow judges/tinyjudge/workflow.yml --jobs 4 --keep-going
+    python run_all_datasets.py --workflow judges/tinyjudge/workflow.yml --resume
 """
 
+import hashlib
+import json
 import os
 import shutil
 import subprocess
 import sys
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, TextIO, Tuple
 
 import yaml
 
+from judges.shared.metrics import read_metrics
+
 
 @dataclass
 class Dataset:
@@ -111,18 +121,144 @@ def run_dir(out_dir: Path, workflow: Path, dataset_name: str, variant: str | Non
     return out_dir / dataset_name / workflow.parent.name / leaf
 
 
-def run_meta_evaluate(dataset: Dataset, dataset_out: Path) -> None:
+def log_file(dataset_out: Path) -> Path:
+    """Per-job log for --jobs N, a sibling of the run directory (<leaf>.log) so it is never
+    swept up by `tira-cli upload --directory` or the *.eval.txt globs."""
+    return dataset_out.parent / f"{dataset_out.name}.log"
+
+
+def manifest_file(dataset_out: Path) -> Path:
+    """Completion manifest for --resume, a sibling of the run directory like log_file()."""
+    return dataset_out.parent / f"{dataset_out.name}.manifest.json"
+
+
+def _sha256_path(path: Path) -> str:
+    """Content hash of a file, or of every file below a directory (relative names included)."""
+    if not path.exists():
+        return "missing"
+    h = hashlib.sha256()
+    files: List[Path] = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+    for f in files:
+        if f != path:
+            h.update(f.relative_to(path).as_posix().encode("utf-8") + b"\0")
+        with open(f, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _stat_key(path: Path) -> str:
+    """Cheap change detector for _sha256_path(): names, sizes and mtimes, without reading contents."""
+    if not path.exists():
+        return "missing"
+    h = hashlib.sha256()
+    files: List[Path] = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+    for f in files:
+        if f != path:
+            h.update(f.relative_to(path).as_posix().encode("utf-8") + b"\0")
+        st: os.stat_result = f.stat()
+        h.update(f"{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _sha256_json(obj: Any) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def input_stats(dataset: Dataset) -> Dict[str, str]:
+    """Stat keys of the dataset's input files, recorded in the manifest next to their content hashes."""
+    return {"responses": _stat_key(Path(dataset.responses)), "topics": _stat_key(Path(dataset.topics))}
+
+
+def run_fingerprint(
+    workflow: Path,
+    dataset: Dataset,
+    runs_filter: str,
+    topics_filter: str,
+    extra_args: List[str],
+    variant: str | None = None,
+    stats: Dict[str, str] | None = None,
+    manifest: Dict[str, Any] | None = None,
+) -> Dict[str, str]:
+    """Hashes of everything that determines a run's output. The workflow is hashed as resolved for
+    `variant` (other variants and sweeps are dropped), so editing an unrelated variant does not
+    invalidate a finished run; the filters are hashed as the run/topic lists they select.
+
+    Responses and topics are content hashes. Given their current `stats` (input_stats()) and the
+    previous `manifest` (read_manifest()), an input whose stat key is unchanged reuses the recorded
+    hash instead of being read again, so only new or modified inputs are hashed."""
+    wf: Dict[str, Any] = yaml.safe_load(workflow.read_text(encoding="utf-8")) or {}
+    variants: Dict[str, Any] = wf.pop("variants", None) or {}
+    wf.pop("sweeps", None)
+    filters: Dict[str, Any] = {
+        "runs": dataset.prio1_runs if runs_filter == "prio1" else "all",
+        "topics": dataset.assessed_topics if topics_filter == "assessed" else "all",
+    }
+    known_hashes: Dict[str, str] = (manifest or {}).get("hashes") or {}
+    known_stats: Dict[str, str] = (manifest or {}).get("stats") or {}
+
+    def content_hash(name: str, path: str) -> str:
+        if stats and name in known_hashes and known_stats.get(name) == stats.get(name):
+            return known_hashes[name]
+        return _sha256_path(Path(path))
+
+    return {
+        "workflow": _sha256_json({"workflow": wf, "variant": variant, "overrides": variants.get(variant) if variant else None}),
+        "responses": content_hash("responses", dataset.responses),
+        "topics": content_hash("topics", dataset.topics),
+        "corpus": _sha256_json(dataset.corpus),
+        "filters": _sha256_json(filters),
+        "extra_args": _sha256_json(extra_args),
+    }
+
+
+def write_manifest(dataset_out: Path, fingerprint: Dict[str, str], stats: Dict[str, str] | None = None) -> None:
+    """Record a completed run (called only after `auto-judge run` succeeded)."""
+    manifest: Dict[str, Any] = {
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+        "run_dir": str(dataset_out),
+        "hashes": fingerprint,
+        "stats": stats or {},
+    }
+    manifest_file(dataset_out).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def read_manifest(dataset_out: Path) -> Dict[str, Any]:
+    """The run directory's completion manifest, or {} if there is none (or it is unreadable)."""
+    try:
+        manifest: Any = json.loads(manifest_file(dataset_out).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def manifest_matches(dataset_out: Path, fingerprint: Dict[str, str]) -> bool:
+    """True if the run directory holds a completed run of exactly these inputs (--resume skips it)."""
+    if not dataset_out.is_dir():
+        return False
+    return read_manifest(dataset_out).get("hashes") == fingerprint
+
+
+def _call(cmd: List[str], log: TextIO | None = None) -> int:
+    """Run a command to completion, inheriting the terminal or appending to `log`."""
+    if log is None:
+        return subprocess.run(cmd).returncode
+    log.flush()  # keep our own header lines ahead of the child's output
+    return subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT).returncode
+
+
+def run_meta_evaluate(dataset: Dataset, dataset_out: Path, log: TextIO | None = None) -> None:
     """Invoke auto-judge-evaluate meta-evaluate against the dataset's truth file, if available."""
     if not dataset.truth:
-        print(f"Skipping meta-evaluation for {dataset.name}: no 'truth' in datasets.yml")
+        print(f"Skipping meta-evaluation for {dataset.name}: no 'truth' in datasets.yml", file=log)
         return
     if shutil.which("auto-judge-evaluate") is None:
-        print("Skipping meta-evaluation: auto-judge-evaluate not installed.")
-        print("Install with: uv pip install -e '.[evaluate]'")
+        print("Skipping meta-evaluation: auto-judge-evaluate not installed.", file=log)
+        print("Install with: uv pip install -e '.[evaluate]'", file=log)
         return
     eval_files: List[Path] = sorted(dataset_out.glob("*.eval.txt"))
     if not eval_files:
-        print(f"Skipping meta-evaluation for {dataset.name}: no *.eval.txt in {dataset_out}")
+        print(f"Skipping meta-evaluation for {dataset.name}: no *.eval.txt in {dataset_out}", file=log)
         return
 
     cmd: List[str] = [
@@ -133,17 +269,17 @@ def run_meta_evaluate(dataset: Dataset, dataset_out: Path) -> None:
         "--on-missing", "default",
         *[str(p) for p in eval_files],
     ]
-    print(f"\n=== Meta-evaluation: {dataset.name} (truth={dataset.truth}) ===")
-    subprocess.run(cmd)
+    print(f"\n=== Meta-evaluation: {dataset.name} (truth={dataset.truth}) ===", file=log)
+    _call(cmd, log)
 
 
-def run_tira_upload(dataset: Dataset, dataset_out: Path, system: str) -> None:
+def run_tira_upload(dataset: Dataset, dataset_out: Path, system: str, log: TextIO | None = None) -> None:
     """Upload the run output to TIRA via `tira-cli upload` (data submission), if the dataset has a tira_id."""
     if not dataset.tira_id:
-        print(f"Skipping TIRA upload for {dataset.name}: no 'tira_id' in datasets.yml")
+        print(f"Skipping TIRA upload for {dataset.name}: no 'tira_id' in datasets.yml", file=log)
         return
     if shutil.which("tira-cli") is None:
-        print("Skipping TIRA upload: tira-cli not installed (uv pip install -e '.[tira]').")
+        print("Skipping TIRA upload: tira-cli not installed (uv pip install -e '.[tira]').", file=log)
         return
     cmd: List[str] = [
         "tira-cli", "upload",
@@ -151,49 +287,41 @@ def run_tira_upload(dataset: Dataset, dataset_out: Path, system: str) -> None:
         "--directory", str(dataset_out),
         "--system", system,
     ]
-    print(f"\n=== TIRA data upload: {dataset.name} -> {dataset.tira_id} (system={system}) ===")
-    subprocess.run(cmd)
+    print(f"\n=== TIRA data upload: {dataset.name} -> {dataset.tira_id} (system={system}) ===", file=log)
+    _call(cmd, log)
 
 
-def run_metaeval_upload(dataset: Dataset, dataset_out: Path, dest: str | None) -> None:
+def run_metaeval_upload(dataset: Dataset, dataset_out: Path, dest: str | None, log: TextIO | None = None) -> None:
     """Deposit *.eval.txt into the meta-evaluation service's per-track bucket via rsync."""
     if not dataset.bucket:
-        print(f"Skipping meta-eval upload for {dataset.name}: no 'bucket' in datasets.yml")
+        print(f"Skipping meta-eval upload for {dataset.name}: no 'bucket' in datasets.yml", file=log)
         return
     if not dest:
-        print(f"Skipping meta-eval upload for {dataset.name}: pass --metaeval-dest (e.g. c02:/autojudge-eval/in)")
+        print(f"Skipping meta-eval upload for {dataset.name}: pass --metaeval-dest (e.g. c02:/autojudge-eval/in)", file=log)
         return
     if shutil.which("rsync") is None:
-        print("Skipping meta-eval upload: rsync not installed.")
+        print("Skipping meta-eval upload: rsync not installed.", file=log)
         return
     eval_files: List[Path] = sorted(dataset_out.glob("*.eval.txt"))
     if not eval_files:
-        print(f"Skipping meta-eval upload for {dataset.name}: no *.eval.txt in {dataset_out}")
+        print(f"Skipping meta-eval upload for {dataset.name}: no *.eval.txt in {dataset_out}", file=log)
         return
     bucket_dest: str = dest.rstrip("/") + "/" + dataset.bucket + "/"
     cmd: List[str] = ["rsync", "-Laur", *[str(p) for p in eval_files], bucket_dest]
-    print(f"\n=== Meta-eval service deposit: {dataset.name} -> {bucket_dest} ===")
-    subprocess.run(cmd)
+    print(f"\n=== Meta-eval service deposit: {dataset.name} -> {bucket_dest} ===", file=log)
+    _call(cmd, log)
 
 
-def run_workflow(
+def workflow_command(
     workflow: Path,
     dataset: Dataset,
-    out_dir: Path,
+    dataset_out: Path,
     runs_filter: str,
     topics_filter: str,
     extra_args: List[str],
     variant: str | None = None,
-    meta_evaluate: bool = False,
-    upload_tira: bool = False,
-    upload_metaeval: bool = False,
-    metaeval_dest: str | None = None,
-) -> bool:
-    """Run the workflow against a single dataset. Returns True on success."""
-    # Separate results by dataset/workflow/variant so different judges never share a dir
-    dataset_out: Path = run_dir(out_dir, workflow, dataset.name, variant, runs_filter, topics_filter)
-    dataset_out.mkdir(parents=True, exist_ok=True)
-
+) -> List[str]:
+    """The `auto-judge run` command line for one dataset."""
     cmd: List[str] = [
         "auto-judge", "run",
         "--workflow", str(workflow),
@@ -219,37 +347,221 @@ def run_workflow(
             cmd.extend(["--topic", str(topic_id)])
 
     cmd.extend(extra_args)
+    return cmd
 
-    print(f"\n{'='*60}")
-    print(f"Running: {dataset.name} (runs={runs_filter}, topics={topics_filter})")
-    print(f"  Responses: {dataset.responses}")
-    print(f"  Topics: {dataset.topics}")
+
+def _print_run_header(dataset: Dataset, dataset_out: Path, runs_filter: str, topics_filter: str,
+                      log: TextIO | None = None) -> None:
+    print(f"\n{'='*60}", file=log)
+    print(f"Running: {dataset.name} (runs={runs_filter}, topics={topics_filter})", file=log)
+    print(f"  Responses: {dataset.responses}", file=log)
+    print(f"  Topics: {dataset.topics}", file=log)
     if runs_filter == "prio1":
-        print(f"  Prio1 runs: {len(dataset.prio1_runs)} run(s)")
+        print(f"  Prio1 runs: {len(dataset.prio1_runs)} run(s)", file=log)
     if topics_filter == "assessed":
-        print(f"  Assessed topics: {len(dataset.assessed_topics)} topic(s)")
-    print(f"  Output: {dataset_out}")
-    print(f"{'='*60}\n")
+        print(f"  Assessed topics: {len(dataset.assessed_topics)} topic(s)", file=log)
+    print(f"  Output: {dataset_out}", file=log)
+    print(f"{'='*60}\n", file=log)
+
+
+def run_post_hooks(
+    workflow: Path,
+    dataset: Dataset,
+    dataset_out: Path,
+    variant: str | None = None,
+    meta_evaluate: bool = False,
+    upload_tira: bool = False,
+    upload_metaeval: bool = False,
+    metaeval_dest: str | None = None,
+    log: TextIO | None = None,
+) -> None:
+    """List the files a successful run produced, then meta-evaluate and upload as requested."""
+    produced: List[Path] = sorted(p for p in dataset_out.iterdir() if p.is_file())
+    print(f"\n=== Output files in {dataset_out} ({len(produced)}) ===", file=log)
+    if produced:
+        for p in produced:
+            print(f"  {p.name}", file=log)
+    else:
+        print("  (no files produced)", file=log)
+    system: str = f"{workflow.parent.name}-{variant or 'default'}"
+    if meta_evaluate:
+        run_meta_evaluate(dataset, dataset_out, log)
+    if upload_tira:
+        run_tira_upload(dataset, dataset_out, system, log)
+    if upload_metaeval:
+        run_metaeval_upload(dataset, dataset_out, metaeval_dest, log)
 
+
+def run_workflow(
+    workflow: Path,
+    dataset: Dataset,
+    out_dir: Path,
+    runs_filter: str,
+    topics_filter: str,
+    extra_args: List[str],
+    variant: str | None = None,
+    meta_evaluate: bool = False,
+    upload_tira: bool = False,
+    upload_metaeval: bool = False,
+    metaeval_dest: str | None = None,
+) -> bool:
+    """Run the workflow against a single dataset. Returns True on success."""
+    # Separate results by dataset/workflow/variant so different judges never share a dir
+    dataset_out: Path = run_dir(out_dir, workflow, dataset.name, variant, runs_filter, topics_filter)
+    dataset_out.mkdir(parents=True, exist_ok=True)
+
+    cmd: List[str] = workflow_command(workflow, dataset, dataset_out, runs_filter, topics_filter, extra_args, variant)
+    _print_run_header(dataset, dataset_out, runs_filter, topics_filter)
+
+    # Fingerprint the inputs as they are now; drop the old manifest so a failed rerun is not "complete"
+    stats: Dict[str, str] = input_stats(dataset)
+    fingerprint: Dict[str, str] = run_fingerprint(workflow, dataset, runs_filter, topics_filter, extra_args, variant,
+                                                  stats, read_manifest(dataset_out))
+    manifest_file(dataset_out).unlink(missing_ok=True)
     result: subprocess.CompletedProcess[bytes] = subprocess.run(cmd)
     if result.returncode == 0:
-        produced: List[Path] = sorted(p for p in dataset_out.iterdir() if p.is_file())
-        print(f"\n=== Output files in {dataset_out} ({len(produced)}) ===")
-        if produced:
-            for p in produced:
-                print(f"  {p.name}")
-        else:
-            print("  (no files produced)")
-        system: str = f"{workflow.parent.name}-{variant or 'default'}"
-        if meta_evaluate:
-            run_meta_evaluate(dataset, dataset_out)
-        if upload_tira:
-            run_tira_upload(dataset, dataset_out, system)
-        if upload_metaeval:
-            run_metaeval_upload(dataset, dataset_out, metaeval_dest)
+        write_manifest(dataset_out, fingerprint, stats)
+        run_post_hooks(workflow, dataset, dataset_out, variant, meta_evaluate, upload_tira, upload_metaeval, metaeval_dest)
     return result.returncode == 0
 
 
+def run_parallel(
+    workflow: Path,
+    datasets: List[Dataset],
+    out_dir: Path,
+    runs_filter: str,
+    topics_filter: str,
+    extra_args: List[str],
+    jobs: int,
+    keep_going: bool = False,
+    variant: str | None = None,
+    meta_evaluate: bool = False,
+    upload_tira: bool = False,
+    upload_metaeval: bool = False,
+    metaeval_dest: str | None = None,
+) -> Dict[str, str]:
+    """Run the workflow against several datasets at once, at most `jobs` `auto-judge run` processes
+    at a time (--jobs N). Most of a judging run is spent waiting on the LLM endpoint, so the
+    datasets overlap instead of adding up.
+
+    Each job writes to its own log_file() instead of interleaving on the terminal; only one status
+    line per start/finish is printed. Post-run hooks (meta-evaluate, TIRA and meta-eval uploads) run
+    on a separate pool, so an upload overlaps with the next judging job, and append to the same log.
+    Without keep_going the first failure cancels queued jobs and terminates running ones. A hook
+    that raises marks its run HOOK FAILED (the traceback goes to the run's log).
+
+    Returns {run-dir key: OK | FAILED | HOOK FAILED | CANCELLED} in dataset order, like the
+    sequential loop."""
+    keys: List[str] = [
+        str(run_dir(out_dir, workflow, d.name, variant, runs_filter, topics_filter).relative_to(out_dir))
+        for d in datasets
+    ]
+    results: Dict[str, str] = {key: "CANCELLED" for key in keys}
+    running: Dict[str, subprocess.Popen[bytes]] = {}
+    lock: threading.Lock = threading.Lock()
+    stop: threading.Event = threading.Event()
+
+    def hooks(dataset: Dataset, dataset_out: Path) -> None:
+        with open(log_file(dataset_out), "a", encoding="utf-8") as log:
+            try:
+                run_post_hooks(workflow, dataset, dataset_out, variant, meta_evaluate, upload_tira,
+                               upload_metaeval, metaeval_dest, log)
+            except Exception:
+                traceback.print_exc(file=log)
+                raise
+
+    def job(key: str, dataset: Dataset) -> bool | None:
+        """Run one dataset; None if it was cancelled before it started."""
+        dataset_out: Path = run_dir(out_dir, workflow, dataset.name, variant, runs_filter, topics_filter)
+        cmd: List[str] = workflow_command(workflow, dataset, dataset_out, runs_filter, topics_filter, extra_args, variant)
+        stats: Dict[str, str] = input_stats(dataset)
+        fingerprint: Dict[str, str] = run_fingerprint(workflow, dataset, runs_filter, topics_filter, extra_args, variant,
+                                                      stats, read_manifest(dataset_out))
+        with lock:
+            # Touch nothing until the run really starts: a job cancelled here keeps its previous
+            # manifest and log, so --resume still sees the earlier completed run
+            if stop.is_set():
+                return None
+            dataset_out.mkdir(parents=True, exist_ok=True)
+            manifest_file(dataset_out).unlink(missing_ok=True)
+            with open(log_file(dataset_out), "w", encoding="utf-8") as log:
+                _print_run_header(dataset, dataset_out, runs_filter, topics_filter, log)
+                log.flush()
+                proc: subprocess.Popen[bytes] = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+            running[key] = proc
+        print(f"[start] {key} (log: {log_file(dataset_out)})")
+        returncode: int = proc.wait()
+        with lock:
+            del running[key]
+        if returncode == 0:
+            write_manifest(dataset_out, fingerprint, stats)
+        return returncode == 0
+
+    def cancel() -> None:
+        stop.set()
+        with lock:
+            for proc in running.values():
+                proc.terminate()
+
+    hook_futures: Dict[str, Future[None]] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as judge_pool, ThreadPoolExecutor(max_workers=jobs) as hook_pool:
+        futures: Dict[Future[bool | None], Tuple[str, Dataset]] = {
+            judge_pool.submit(job, key, dataset): (key, dataset) for key, dataset in zip(keys, datasets)
+        }
+        try:
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue  # never started: shut down after an earlier failure
+                key, dataset = futures[future]
+                success: bool | None = future.result()
+                if success is None or (stop.is_set() and not success):
+                    continue  # cancelled, or terminated by an earlier failure
+                results[key] = "OK" if success else "FAILED"
+                dataset_out = run_dir(out_dir, workflow, dataset.name, variant, runs_filter, topics_filter)
+                print(f"[{'done' if success else 'FAILED'}] {key}")
+                if success:
+                    hook_futures[key] = hook_pool.submit(hooks, dataset, dataset_out)
+                elif not keep_going:
+                    print(f"\nFailed on {key} (log: {log_file(dataset_out)}). Cancelling remaining jobs; "
+                          "use --keep-going to continue on errors.")
+                    cancel()
+                    judge_pool.shutdown(wait=False, cancel_futures=True)
+        except KeyboardInterrupt:
+            cancel()
+            judge_pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # The hook pool has drained: surface hooks that raised instead of reporting the run as OK
+    for key, hook_future in hook_futures.items():
+        try:
+            hook_future.result()
+        except Exception as e:
+            results[key] = "HOOK FAILED"
+            print(f"[HOOK FAILED] {key}: {type(e).__name__}: {e} (log: {log_file(out_dir / key)})")
+    return results
+
+
+def metrics_table(out_dir: Path, keys: List[str]) -> List[str]:
+    """Rows comparing cost and speed across finished runs, from each run's *.metrics.json.
+    Empty when no run wrote metrics."""
+    rows: List[Tuple[str, ...]] = []
+    for key in keys:
+        m = read_metrics(out_dir / key)
+        if m is None:
+            continue
+        c: Dict[str, int] = m["counters"]
+        results: int = c.get("llm_results", 0)
+        hit_rate: str = f"{c.get('cache_hits', 0) / results:.0%}" if results else "-"
+        rows.append((key, f"{m['wall_s']:.1f}", str(c.get("responses", "-")), str(c.get("llm_calls", 0)),
+                     str(c.get("input_tokens", 0)), str(c.get("output_tokens", 0)), hit_rate,
+                     str(c.get("llm_failures", 0))))
+    if not rows:
+        return []
+    header = ("run", "wall_s", "responses", "llm_calls", "tokens_in", "tokens_out", "cache_hits", "failures")
+    widths = [max(len(r[i]) for r in [header, *rows]) for i in range(len(header))]
+    return ["  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in [header, *rows]]
+
+
 def main() -> None:
     import argparse
 
@@ -278,6 +590,10 @@ def main() -> None:
                         help="Restrict to dataset(s) by name (repeatable). Default: all datasets in the config.")
     parser.add_argument("--dry-run", action="store_true", help="Print commands without executing")
     parser.add_argument("--keep-going", "-k", action="store_true", help="Continue on errors instead of failing fast")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip datasets whose run directory has a completion manifest matching the current workflow/variant, responses, topics, filters and extra args")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Run up to N datasets at once, each logging to <run-dir>.log; post-run hooks overlap with judging (default: 1, sequential)")
 
     # Capture remaining args to pass through to auto-judge
     args: Any
@@ -352,8 +668,24 @@ def main() -> None:
         info_str: str = f" ({', '.join(info)})" if info else ""
         print(f"  - {d.name}{info_str}")
 
+    # --resume: datasets whose completion manifest still matches their inputs are not run again
+    skipped: List[str] = []
+    if args.resume:
+        for d in datasets:
+            ddir: Path = run_dir(out_dir, workflow, d.name, args.variant, args.runs, args.topics)
+            fingerprint: Dict[str, str] = run_fingerprint(workflow, d, args.runs, args.topics, extra, args.variant,
+                                                          input_stats(d), read_manifest(ddir))
+            if manifest_matches(ddir, fingerprint):
+                skipped.append(d.name)
+        if skipped:
+            print(f"Resume: {len(skipped)} dataset(s) already complete with unchanged inputs: {', '.join(skipped)}")
+
     if args.dry_run:
         for dataset in datasets:
+            if dataset.name in skipped:
+                print(f"\nWould skip: {dataset.name} (completed, manifest matches: "
+                      f"{manifest_file(run_dir(out_dir, workflow, dataset.name, args.variant, args.runs, args.topics))})")
+                continue
             print(f"\nWould run: {dataset.name}")
             cmd_parts: List[str] = [
                 f"auto-judge run --workflow {workflow}",
@@ -386,28 +718,53 @@ def main() -> None:
                     print(f"  # (skip meta-eval upload: needs bucket + --metaeval-dest for {dataset.name})")
         return
 
-    # Run each dataset
-    results: Dict[str, str] = {}
-    for dataset in datasets:
-        key: str = str(run_dir(out_dir, workflow, dataset.name, args.variant, args.runs, args.topics).relative_to(out_dir))
-        success: bool = run_workflow(workflow, dataset, out_dir, args.runs, args.topics, extra, variant=args.variant, meta_evaluate=args.meta_evaluate, upload_tira=args.upload_tira, upload_metaeval=args.upload_metaeval, metaeval_dest=args.metaeval_dest)
-        results[key] = "OK" if success else "FAILED"
+    # Run each dataset: several at once with --jobs N (per-job logs), otherwise one after another.
+    # Seed the results in dataset order so the summary lists skipped datasets in place.
+    results: Dict[str, str] = {
+        str(run_dir(out_dir, workflow, d.name, args.variant, args.runs, args.topics).relative_to(out_dir)):
+            "SKIPPED (up to date)" if d.name in skipped else "PENDING"
+        for d in datasets
+    }
+    skipped_keys: set[str] = {k for k, status in results.items() if status != "PENDING"}
+    datasets = [d for d in datasets if d.name not in skipped]
+    if args.jobs > 1:
+        print(f"\nRunning {len(datasets)} dataset(s) with --jobs {args.jobs}; per-job logs next to each run directory")
+        results |= run_parallel(workflow, datasets, out_dir, args.runs, args.topics, extra, args.jobs, keep_going=args.keep_going, variant=args.variant, meta_evaluate=args.meta_evaluate, upload_tira=args.upload_tira, upload_metaeval=args.upload_metaeval, metaeval_dest=args.metaeval_dest)
+    else:
+        for dataset in datasets:
+            key: str = str(run_dir(out_dir, workflow, dataset.name, args.variant, args.runs, args.topics).relative_to(out_dir))
+            success: bool = run_workflow(workflow, dataset, out_dir, args.runs, args.topics, extra, variant=args.variant, meta_evaluate=args.meta_evaluate, upload_tira=args.upload_tira, upload_metaeval=args.upload_metaeval, metaeval_dest=args.metaeval_dest)
+            results[key] = "OK" if success else "FAILED"
 
-        # Fail fast unless --keep-going
-        if not success and not args.keep_going:
-            print(f"\nFailed on {key}. Use --keep-going to continue on errors.")
-            sys.exit(1)
+            # Fail fast unless --keep-going
+            if not success and not args.keep_going:
+                print(f"\nFailed on {key}. Use --keep-going to continue on errors.")
+                sys.exit(1)
 
     # Summary
     print(f"\n{'='*60}")
     print("Summary:")
     print(f"{'='*60}")
     for name, status in results.items():
-        print(f"  {name}: {status}")
+        if args.jobs > 1 and name not in skipped_keys:
+            print(f"  {name}: {status} (log: {log_file(out_dir / name)})")
+        else:
+            print(f"  {name}: {status}")
+
+    judged: set[str] = {"OK", "HOOK FAILED"}  # the judge run itself completed
+    table: List[str] = metrics_table(out_dir, [k for k, status in results.items() if status in judged or k in skipped_keys])
+    if table:
+        print("\nCost and speed (from *.metrics.json):")
+        for line in table:
+            print(f"  {line}")
 
     failed: int = sum(1 for s in results.values() if s == "FAILED")
+    hook_failed: int = sum(1 for s in results.values() if s == "HOOK FAILED")
     if failed:
         print(f"\n{failed} dataset(s) failed.")
+    if hook_failed:
+        print(f"\n{hook_failed} dataset(s) judged, but a post-run hook (meta-evaluate/upload) failed.")
+    if failed or hook_failed:
         sys.exit(1)
 
 
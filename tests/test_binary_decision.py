@@ -0,0 +1,39 @@
+"""Checks the binary-decision profile and graded probabilities from first-token logprobs."""
+
+import math
+
+import pytest
+
+minima_llm = pytest.importorskip("minima_llm")
+from minima_llm import MinimaLlmRequest  # noqa: E402
+
+from judges.shared.binary_decision import apply_binary_profile, binary_probability, binary_profile  # noqa: E402
+
+
+def _raw(*tokens):
+    """Chat-completion JSON whose answer tokens carry the given {token: probability} alternatives."""
+    content = [{"token": max(alts, key=alts.get), "logprob": 0.0,
+                "top_logprobs": [{"token": t, "logprob": math.log(p)} for t, p in alts.items()]}
+               for alts in tokens]
+    return {"choices": [{"message": {"content": ""}, "logprobs": {"content": content}}]}
+
+
+def test_probability_renormalizes_and_skips_leading_tokens():
+    assert binary_probability(_raw({"1": 0.6, "0": 0.2, "Yes": 0.2})) == pytest.approx(0.75)
+    assert binary_probability(_raw({" ": 0.9, "\n": 0.1}, {" 0": 0.5, "1": 0.5})) == pytest.approx(0.5)
+
+
+def test_no_usable_logprobs_means_fall_back_to_text():
+    assert binary_probability(None) is None
+    assert binary_probability({"choices": [{"message": {"content": "1"}}]}) is None
+    assert binary_probability(_raw({"Sure": 1.0})) is None
+
+
+def test_profile_sets_cap_stop_and_logprobs():
+    req = MinimaLlmRequest(request_id="q", messages=[{"role": "user", "content": "x"}])
+    shaped = apply_binary_profile(req, binary_profile({"max_tokens": 2, "top_logprobs": 3}))
+    assert shaped.max_tokens == 2
+    assert shaped.extra == {"stop": ["\n"], "logprobs": True, "top_logprobs": 3}
+    assert apply_binary_profile(req, binary_profile(None)) is req
+    with pytest.raises(ValueError):
+        binary_profile({"max_token": 2})
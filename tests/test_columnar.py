@@ -0,0 +1,96 @@
+"""Checks the columnar leaderboard API against row-by-row `add`, and bulk word counting."""
+
+import numpy as np
+import pytest
+
+from autojudge_base import LeaderboardBuilder, LeaderboardEntry, LeaderboardSpec, MeasureSpec
+
+from judges.shared.columnar import ColumnarLeaderboardBuilder, count_words
+
+SPEC = LeaderboardSpec(measures=(
+    MeasureSpec("LENGTH", int),
+    MeasureSpec("SCORE"),
+    MeasureSpec("LABEL", str),
+))
+
+
+def test_add_columns_matches_add():
+    run_ids = ["r1", "r1", "r2", "r2"]
+    topic_ids = ["t1", "t2", "t1", "t2"]
+    lengths = np.array([3, 0, 7, 12])
+    scores = np.array([0.1, 0.25, 1 / 3, 0.9])
+    labels = ["a", "b", "c", "d"]
+
+    rows = LeaderboardBuilder(SPEC)
+    for i in range(len(run_ids)):
+        rows.add(run_id=run_ids[i], topic_id=topic_ids[i],
+                 values={"LENGTH": lengths[i], "SCORE": scores[i], "LABEL": labels[i]})
+    columns = ColumnarLeaderboardBuilder(SPEC)
+    columns.add_columns(run_ids=run_ids, topic_ids=topic_ids,
+                        columns={"LENGTH": lengths, "SCORE": scores, "LABEL": labels})
+
+    assert columns.entries() == rows.entries()
+    assert all(type(e.values["LENGTH"]) is int and type(e.values["SCORE"]) is float for e in columns.entries())
+    assert columns.build().entries == rows.build().entries
+
+
+def test_upstream_builder_keeps_added_rows_in_rows_list():
+    # add_columns appends to LeaderboardBuilder._rows directly; pin what it relies on
+    builder = LeaderboardBuilder(SPEC)
+    builder.add(run_id="r1", topic_id="t1", values={"LENGTH": 1, "SCORE": 0.5, "LABEL": "x"})
+    assert isinstance(builder._rows, list)
+    assert tuple(builder._rows) == builder.entries()
+    builder._rows.append(LeaderboardEntry(run_id="r1", topic_id="t2", values={"LENGTH": 2, "SCORE": 0.1, "LABEL": "y"}))
+    assert [e.topic_id for e in builder.entries()] == ["t1", "t2"]
+    assert {e.topic_id for e in builder.build().entries} >= {"t1", "t2"}
+
+
+def test_add_columns_falls_back_to_add_without_rows_list():
+    class _NoRows(ColumnarLeaderboardBuilder):
+        def __init__(self, spec):
+            super().__init__(spec)
+            del self._rows
+            self.added = []
+
+        def add(self, *, run_id, topic_id, values):
+            self.added.append((run_id, topic_id, values))
+
+    builder = _NoRows(SPEC)
+    builder.add_columns(run_ids=["r1"], topic_ids=["t1"], columns={"LENGTH": [2], "SCORE": [0.5], "LABEL": ["x"]})
+    assert builder.added == [("r1", "t1", {"LENGTH": 2, "SCORE": 0.5, "LABEL": "x"})]
+
+
+def test_add_columns_is_strict():
+    builder = ColumnarLeaderboardBuilder(SPEC)
+    with pytest.raises(KeyError):
+        builder.add_columns(run_ids=["r"], topic_ids=["t"], columns={"LENGTH": [1], "SCORE": [0.5]})
+    with pytest.raises(ValueError):
+        builder.add_columns(run_ids=["r"], topic_ids=["t"], columns={"LENGTH": [1, 2], "SCORE": [0.5], "LABEL": ["x"]})
+
+
+def test_count_words_matches_split():
+    texts = ["", "   ", "one", " two  words ", "tabs\tand\nnewlines\r\n", "x\x1cy",
+             "non\xa0breaking\u2009space", "caf\u00e9 au lait", "\u3000ideographic\u3000space"]
+    assert count_words(texts).tolist() == [len(t.split()) for t in texts]
+
+
+def test_qrels_columns_match_build_qrels(tmp_path):
+    from autojudge_base.qrels.qrels import QrelsSpec, build_qrels, write_qrel_file
+
+    from judges.shared.columnar import build_qrels_columns, write_qrels_columns
+
+    rows = [("t2", "d1", 1), ("t1", "d9", 0), ("t1", "d1", 2), ("t2", "d1", 3), ("t1", "d1", 1), ("t10", "d1", 2)]
+    topic_ids, doc_ids, grades = (list(col) for col in zip(*rows))
+
+    for policy in ("keep_max", "keep_last"):
+        spec = QrelsSpec(topic_id=lambda r: r[0], doc_id=lambda r: r[1], grade=lambda r: r[2], on_duplicate=policy)
+        expected = build_qrels(records=rows, spec=spec)
+        columnar = build_qrels_columns(topic_ids, doc_ids, grades, on_duplicate=policy)
+        assert columnar.rows == sorted(expected.rows, key=lambda r: (r.topic_id, r.doc_id))
+
+        write_qrel_file(qrel_out_file=tmp_path / "objects.txt", qrels=expected)
+        write_qrels_columns(tmp_path / "columns.txt", topic_ids, doc_ids, grades, on_duplicate=policy)
+        assert (tmp_path / "columns.txt").read_text() == (tmp_path / "objects.txt").read_text()
+
+    with pytest.raises(ValueError, match="Duplicate qrel"):
+        build_qrels_columns(topic_ids, doc_ids, grades, on_duplicate="error")
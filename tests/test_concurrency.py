@@ -0,0 +1,141 @@
+"""Checks the AIMD concurrency controller, alone and against a local stand-in endpoint."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+minima_llm = pytest.importorskip("minima_llm")
+from minima_llm import (  # noqa: E402
+    MinimaLlmConfig,
+    MinimaLlmFailure,
+    MinimaLlmRequest,
+    MinimaLlmResponse,
+    OpenAIMinimaLlm,
+)
+
+from judges.shared.concurrency import AimdController  # noqa: E402
+from judges.shared.llm_stream import stream_generate  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _ok():
+    return MinimaLlmResponse(request_id="q", text="1")
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    clock = _Clock()
+    ctl = AimdController(initial=4, max_limit=6, target_p95_s=1.0, log=False, clock=clock)
+
+    # Fast answers with a full window: +1 per interval, up to max_limit
+    for _ in range(4):
+        ctl.note_in_flight(ctl.limit)
+        ctl.observe(0.1, _ok())
+        clock.now += 1.0
+        ctl.maybe_tick()
+    assert [t.limit for t in ctl.trace] == [5, 6, 6, 6]
+
+    # A throttled call halves the limit; so does a slow interval
+    ctl.observe(0.1, MinimaLlmFailure(request_id="q", error_type="HTTPError", message="", attempts=1, status=429))
+    clock.now += 1.0
+    ctl.maybe_tick()
+    ctl.observe(3.0, _ok())
+    clock.now += 1.0
+    ctl.maybe_tick()
+    assert [t.limit for t in ctl.trace[-2:]] == [3, 1]
+
+    # Fast answers without saturating the window leave the limit alone
+    ctl.note_in_flight(0)
+    clock.now += 1.0
+    ctl.maybe_tick()
+    ctl.observe(0.1, _ok())
+    clock.now += 1.0
+    ctl.maybe_tick()
+    assert ctl.limit == 1
+
+
+class _ThrottlingEndpoint:
+    """Chat-completions stand-in that answers 429 while more than `capacity` requests are open."""
+
+    def __init__(self, capacity: int, delay_s: float):
+        self.open = 0
+        self.peak = 0
+        self.throttled = 0
+        lock = threading.Lock()
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with lock:
+                    outer.open += 1
+                    outer.peak = max(outer.peak, outer.open)
+                    over = outer.open > capacity
+                    outer.throttled += over
+                try:
+                    time.sleep(delay_s)
+                    if over:
+                        status, payload = 429, {"error": {"message": "slow down", "type": "rate_limit"}}
+                    else:
+                        status, payload = 200, {
+                            "id": "fake", "object": "chat.completion", "created": 0, "model": "fake",
+                            "choices": [{"index": 0, "finish_reason": "stop",
+                                         "message": {"role": "assistant", "content": "1"}}],
+                            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                        }
+                    body = json.dumps(payload).encode()
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with lock:
+                        outer.open -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def shutdown(self):
+        self.server.shutdown()
+
+
+def test_controller_ramps_up_then_backs_off_on_throttling():
+    endpoint = _ThrottlingEndpoint(capacity=6, delay_s=0.02)
+    cfg = MinimaLlmConfig(base_url=f"http://127.0.0.1:{endpoint.port}/v1", model="test-model",
+                          max_attempts=1, rpm=0, max_outstanding=32, cooldown_cap_s=0.05)
+    backend = OpenAIMinimaLlm(cfg)
+    ctl = AimdController(initial=1, max_limit=32, target_p95_s=1.0, interval_s=0.05, log=False)
+    items = ((i, MinimaLlmRequest(request_id=f"q{i}", messages=[{"role": "user", "content": str(i)}]))
+             for i in range(300))
+
+    async def collect():
+        return [r async for _, r in stream_generate(backend, items, memo=None, controller=ctl)]
+
+    try:
+        results = asyncio.run(collect())
+    finally:
+        endpoint.shutdown()
+
+    assert len(results) == 300
+    limits = [1] + [t.limit for t in ctl.trace]
+    assert max(limits) > 6                       # ramped past the server's capacity ...
+    assert any(t.throttled for t in ctl.trace)   # ... saw the 429s ...
+    for before, tick in zip(limits, ctl.trace):  # ... and backed off whenever it did
+        if tick.throttled:
+            assert tick.limit == max(1, int(before * 0.5))
+    assert endpoint.peak <= max(limits)
@@ -0,0 +1,45 @@
+"""Checks the content-addressed document table and its loader shim."""
+
+import contextlib
+import io
+import json
+from pathlib import Path
+
+from autojudge_base.io import load_runs_failsave
+
+from judges.shared.document_table import DOCUMENT_REFS, DocumentTable, dedup, document_hash, load_runs, sidecar_path
+
+RUNS = Path(__file__).parent.parent / "data" / "kiddie" / "runs" / "repgen"
+
+
+def _quiet(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+def test_document_hash_is_content_addressed(tmp_path):
+    doc = {"id": "d1", "text": "Chlorophyll is green.", "title": "Chlorophyll"}
+    assert document_hash(doc) == document_hash(dict(reversed(list(doc.items()))))
+    assert document_hash(doc) != document_hash({**doc, "text": "Chlorophyll is red."})
+
+    with DocumentTable(tmp_path / "docs.sqlite") as table:
+        assert table.put_many([doc, dict(doc)]) == [document_hash(doc)] * 2
+        assert len(table) == 1
+
+
+def test_dedup_and_load_runs_restore_documents(tmp_path):
+    stats = dedup(RUNS, tmp_path / "runs")
+    assert sidecar_path(tmp_path / "runs").is_file()
+    assert stats.reports == 20 and stats.unique_documents <= stats.documents
+
+    record = json.loads((tmp_path / "runs" / "run1.jsonl").read_text().splitlines()[0])
+    assert "documents" not in record and record[DOCUMENT_REFS]
+
+    expected = _quiet(load_runs_failsave, RUNS)
+    restored = load_runs(tmp_path / "runs")
+    assert [r.model_dump() for r in restored] == [r.model_dump() for r in expected]
+    assert [r.path.name for r in restored] == [r.path.name for r in expected]
+
+    # Without the shim the references are simply not documents
+    plain = _quiet(load_runs_failsave, tmp_path / "runs")
+    assert all(r.documents is None for r in plain)
@@ -0,0 +1,31 @@
+"""Checks the shared LeaderboardJournal: resume after a crash, fingerprint checks, replay."""
+
+from autojudge_base import LeaderboardBuilder, LeaderboardSpec, MeasureSpec
+
+from judges.shared.journal import LeaderboardJournal, journal_file_path
+
+SPEC = LeaderboardSpec(measures=(MeasureSpec("SCORE"),))
+
+
+def test_resume_drops_torn_line_and_checks_fingerprints(tmp_path):
+    filebase = tmp_path / "judge"
+    with LeaderboardJournal(filebase) as journal:
+        journal.append("run1", "t1", {"SCORE": 1.0}, fingerprint="a")
+        journal.append("run1", "t2", {"SCORE": 0.0}, fingerprint="b")
+    with open(journal_file_path(filebase), "a") as fh:
+        fh.write('{"run_id": "run1", "topic_id": "t3", "val')  # killed mid-write
+
+    with LeaderboardJournal(filebase) as journal:
+        assert journal.recall("run1", "t1", "a") == {"SCORE": 1.0}
+        assert journal.recall("run1", "t2", "changed-prompt") is None
+        assert journal.recall("run1", "t3") is None
+        journal.append("run1", "t3", {"SCORE": 0.5})
+
+    builder = LeaderboardBuilder(SPEC)
+    with LeaderboardJournal(filebase) as journal:
+        assert journal.replay(builder) == 3
+    assert sorted(e.topic_id for e in builder.entries()) == ["t1", "t2", "t3"]
+
+    with LeaderboardJournal(filebase, resume=False) as journal:
+        assert journal.entries == {}
+    assert journal_file_path(filebase).read_text() == ""
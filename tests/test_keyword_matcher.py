@@ -0,0 +1,24 @@
+"""Checks ExampleLeaderboardJudge's precompiled title-keyword matcher."""
+
+import random
+
+from judges.complete_example.example_judge import keyword_matcher
+
+
+def test_substring_mode_matches_per_word_scan():
+    rng = random.Random(0)
+    alphabet = "ab c.+?("
+    for _ in range(2000):
+        title = "".join(rng.choices(alphabet, k=rng.randint(0, 8)))
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 20)))
+        matcher = keyword_matcher(title)
+        expected = any(word in text for word in title.split())
+        assert (matcher is not None and matcher.search(text) is not None) == expected
+
+
+def test_word_mode_requires_whole_words():
+    matcher = keyword_matcher("why do leaves change color?", mode="word")
+    assert matcher.search("the leaves fell")
+    assert matcher.search("what color? red")
+    assert not matcher.search("a leaflet on colorful trees")
+    assert keyword_matcher("   ") is None
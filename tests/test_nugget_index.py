@@ -0,0 +1,25 @@
+"""Checks the per-topic nugget summary index against the banks it summarizes."""
+
+from autojudge_base.nugget_data import NuggetBank, NuggetBanks, NuggetClaim, NuggetQuestion
+
+from judges.shared.nugget_index import build_nugget_index
+
+
+def test_index_matches_banks():
+    bank = NuggetBank(query_id="t1", title_query="Leaves")
+    bank.add_nuggets([
+        NuggetQuestion.from_lazy("t1", "Why do leaves change color?", ["chlorophyll", "shorter days"]),
+        NuggetQuestion.from_lazy("t1", "What makes red leaves?", ["anthocyanin"]),
+        NuggetClaim.from_lazy("t1", "Trees drop leaves to save water."),
+    ])
+    empty = NuggetBank(query_id="t2", title_query="Nothing")
+    banks = NuggetBanks.from_banks_list([bank, empty])
+
+    index = build_nugget_index(banks)
+
+    assert index["t1"].count == len(bank.nuggets_as_list()) == 3
+    assert index["t2"].count == 0
+    questions = list(bank.nugget_bank.values())
+    assert index["t1"].question_ids == tuple(q.question_id for q in questions)
+    assert index["t1"].answers[questions[0].question_id] == {"chlorophyll", "shorter days"}
+    assert build_nugget_index(None) == {}
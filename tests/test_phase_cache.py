@@ -0,0 +1,37 @@
+"""Checks that shared phases are computed once per distinct consumed settings and inputs."""
+
+from judges.shared import phase_cache
+from judges.shared.phase_cache import shared_phase
+
+
+class _Creator:
+    def __init__(self):
+        self.calls = 0
+
+    @shared_phase
+    def create_nuggets(self, rag_responses, rag_topics, llm_config, nugget_banks=None,
+                       questions_per_topic: int = 3, filebase="default", outdir=".", **kwargs):
+        self.calls += 1
+        return {"questions": questions_per_topic, "responses": len(rag_responses or [])}
+
+
+def test_reuses_results_across_unconsumed_settings():
+    phase_cache.clear()
+    creator = _Creator()
+    responses, topics = [object(), object()], []
+
+    results = [
+        creator.create_nuggets(rag_responses=responses, rag_topics=topics, llm_config=None,
+                               questions_per_topic=q, keyword_bonus=b, filebase=f"grid-{q}-{b}")
+        for q in (2, 3, 5) for b in (0.1, 0.2, 0.3)
+    ]
+
+    assert creator.calls == 3
+    assert [r["questions"] for r in results] == [2, 2, 2, 3, 3, 3, 5, 5, 5]
+    assert results[0] is results[1]
+
+    # Other responses, or the cache switched off, recompute
+    creator.create_nuggets(rag_responses=[object()], rag_topics=topics, llm_config=None, questions_per_topic=2)
+    creator.create_nuggets(rag_responses=responses, rag_topics=topics, llm_config=None, questions_per_topic=2,
+                           phase_cache=False)
+    assert creator.calls == 5
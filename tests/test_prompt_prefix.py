@@ -0,0 +1,56 @@
+"""Checks prefix-cache-aware request ordering and its savings estimate."""
+
+import pytest
+
+minima_llm = pytest.importorskip("minima_llm")
+from minima_llm import MinimaLlmRequest  # noqa: E402
+
+from judges.shared.prompt_prefix import (  # noqa: E402
+    CHARS_PER_TOKEN,
+    estimate_prefix_savings,
+    prefix_sorted,
+    prefix_sorted_chunks,
+    prompt_text,
+)
+
+
+def _req(query: str, text: str) -> MinimaLlmRequest:
+    return MinimaLlmRequest(request_id=f"{query}-{text}", messages=[
+        {"role": "system", "content": "Judge."},
+        {"role": "user", "content": f"Query: {query}\nText: {text}"},
+    ])
+
+
+ARRIVAL = [("a1", _req("leaf", "one")), ("c1", _req("cloud", "two")), ("a2", _req("leaf", "three")),
+           ("c2", _req("cloud", "four"))]
+
+
+def test_prefix_sorted_groups_requests_by_query():
+    order = [tag for tag, _ in prefix_sorted(ARRIVAL)]
+    assert order == ["c2", "c1", "a1", "a2"]  # by prompt text: "cloud" < "leaf", then by the judged text
+
+
+def test_estimate_prefix_savings_counts_shared_prefixes():
+    head = len("<system>Judge.<user>Query: ")
+    texts = [prompt_text(r) for _, r in ARRIVAL]
+    arrival = estimate_prefix_savings(r for _, r in ARRIVAL)
+    assert arrival.prompt_tokens == sum(map(len, texts)) // CHARS_PER_TOKEN
+    assert arrival.shared_tokens == 3 * head // CHARS_PER_TOKEN
+
+    grouped = estimate_prefix_savings(r for _, r in prefix_sorted(ARRIVAL))
+    shared = head + len("cloud\nText: ") + head + head + len("leaf\nText: ")
+    assert grouped.shared_tokens == shared // CHARS_PER_TOKEN > arrival.shared_tokens
+
+
+def test_prefix_sorted_chunks_reads_lazily():
+    consumed = []
+
+    def arrivals():
+        for item in ARRIVAL:
+            consumed.append(item[0])
+            yield item
+
+    chunks = prefix_sorted_chunks(arrivals(), 2)
+    assert next(chunks)[0] == "c1"   # first chunk: a1, c1
+    assert consumed == ["a1", "c1"]
+    assert [tag for tag, _ in chunks] == ["a1", "c2", "a2"]
@@ -0,0 +1,43 @@
+"""Checks the shared report-text memo: reuse across phases, identity checks and the LRU bound."""
+
+from pathlib import Path
+
+from autojudge_base.io import load_runs_failsave
+from autojudge_base.qrels.qrels import doc_id_md5
+
+from judges.complete_example.example_judge import ExampleLeaderboardJudge, ExampleQrelsCreator
+from judges.shared.report_memo import ReportTextMemo, report_text_memo
+
+RUNS = Path(__file__).resolve().parent.parent / "data" / "kiddie" / "runs" / "repgen"
+
+
+def test_memo_values_and_bounds():
+    reports = load_runs_failsave(RUNS)
+    memo = ReportTextMemo(max_entries=2)
+    for report in reports:
+        assert memo.text(report) == report.get_report_text()
+        assert memo.lower(report) == report.get_report_text().lower()
+        assert memo.doc_id(report) == doc_id_md5(report.get_report_text())
+    assert len(memo) == 2
+    assert memo.misses == len(reports) and memo.hits == 2 * len(reports)
+
+    # Same key, different Report object (e.g. another dataset): recomputed, not reused
+    reloaded = load_runs_failsave(RUNS)[-1]
+    memo.text(reloaded)
+    assert memo.misses == len(reports) + 1
+
+    off = report_text_memo(enabled=False)
+    off.text(reports[0])
+    assert len(off) == 0
+
+
+def test_qrels_and_judge_phases_share_the_memo():
+    reports = load_runs_failsave(RUNS)
+    memo = report_text_memo(max_entries=10_000)
+    memo.clear()
+    misses = memo.misses
+
+    ExampleQrelsCreator().create_qrels(reports, [], None)
+    ExampleLeaderboardJudge().judge(reports, [], None, on_missing_evals="default")
+
+    assert memo.misses - misses == len(reports)
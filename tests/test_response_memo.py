@@ -0,0 +1,168 @@
+"""Checks the shared ResponseMemo: in-batch dedup, reuse across runs, eviction, streaming."""
+
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+minima_llm = pytest.importorskip("minima_llm")
+from minima_llm import MinimaLlmFailure, MinimaLlmRequest, MinimaLlmResponse  # noqa: E402
+
+from judges.shared.llm_stream import stream_generate  # noqa: E402
+from judges.shared.metrics import RunMetrics  # noqa: E402
+from judges.shared.response_memo import ResponseMemo  # noqa: E402
+
+
+class _CountingBackend:
+    """Stands in for OpenAIMinimaLlm: answers every prompt with its own text, except "boom".
+
+    Every fresh answer reports 100 input and 1 output token."""
+
+    def __init__(self):
+        self.cfg = SimpleNamespace(model="test-model")
+        self.dispatched = []
+
+    async def run_batched(self, requests):
+        self.dispatched.extend(r.request_id for r in requests)
+        return [
+            MinimaLlmFailure(request_id=r.request_id, error_type="HTTP", message="boom", attempts=2)
+            if r.messages[0]["content"] == "boom"
+            else MinimaLlmResponse(request_id=r.request_id, text=r.messages[0]["content"].upper(),
+                                   input_tokens=100, output_tokens=1)
+            for r in requests
+        ]
+
+    async def generate(self, req):
+        self.dispatched.append(req.request_id)
+        await asyncio.sleep(0.01)
+        return MinimaLlmResponse(request_id=req.request_id, text=req.messages[0]["content"].upper(),
+                                 input_tokens=100, output_tokens=1)
+
+
+def _req(i, text):
+    return MinimaLlmRequest(request_id=f"q{i}", messages=[{"role": "user", "content": text}], temperature=0.0)
+
+
+def test_duplicates_collapse_and_results_keep_request_ids(tmp_path):
+    backend = _CountingBackend()
+    memo = ResponseMemo(tmp_path / "memo.db")
+    results = asyncio.run(memo.run_batched(backend, [_req(0, "a"), _req(1, "b"), _req(2, "a"), _req(3, "boom")]))
+
+    assert backend.dispatched == ["q0", "q1", "q3"]
+    assert [r.request_id for r in results] == ["q0", "q1", "q2", "q3"]
+    assert [getattr(r, "text", None) for r in results] == ["A", "B", "A", None]
+    assert isinstance(results[3], MinimaLlmFailure)
+    assert (memo.hits, memo.misses, memo.duplicates) == (0, 3, 1)
+    memo.close()
+
+    # A second run answers from the file; only the failure is retried
+    backend = _CountingBackend()
+    memo = ResponseMemo(tmp_path / "memo.db")
+    asyncio.run(memo.run_batched(backend, [_req(7, "a"), _req(8, "boom")]))
+    assert backend.dispatched == ["q8"]
+    assert (memo.hits, memo.misses) == (1, 1)
+    memo.close()
+
+
+def test_size_eviction_keeps_newest(tmp_path):
+    memo = ResponseMemo(tmp_path / "memo.db")
+    for i in range(5):
+        memo.put_many({f"k{i}": str(i)})
+    memo.max_entries = 2
+    assert memo.evict() == 3
+    assert memo.get("k4") == "4" and memo.get("k0") is None
+    memo.close()
+
+
+def test_schema_matches_minima_llm_cache_and_migrates_raw_json(tmp_path):
+    from minima_llm.backend import PromptCache
+
+    # A minima-llm cache file opens as a memo, and the memo reads its raw responses
+    cache = PromptCache(str(tmp_path / "minima_llm.db"))
+    cache.put("k1", "1", {"choices": [{"logprobs": {"content": []}}]})
+    cache.close()
+    memo = ResponseMemo(tmp_path / "minima_llm.db")
+    assert memo.get_response("k1", "q0").raw == {"choices": [{"logprobs": {"content": []}}]}
+    memo.close()
+
+    # Memo files from before the rename keep their raw responses
+    conn = sqlite3.connect(tmp_path / "old.db")
+    conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, response_text TEXT NOT NULL, "
+                 "created_at REAL NOT NULL, raw_json TEXT)")
+    conn.execute("INSERT INTO cache VALUES ('k1', '1', 0.0, '{\"x\": 1}')")
+    conn.commit()
+    conn.close()
+    memo = ResponseMemo(tmp_path / "old.db")
+    assert memo.get_response("k1", "q0").raw == {"x": 1}
+    memo.put_many({"k2": MinimaLlmResponse(request_id="q1", text="0", raw={"y": 2})})
+    assert memo.get_response("k2", "q1").raw == {"y": 2}
+    memo.close()
+
+
+def test_streaming_collapses_in_flight_twins():
+    backend = _CountingBackend()
+    memo = ResponseMemo()
+    items = ((i, _req(i, text)) for i, text in enumerate(["a", "b", "a", "c", "a"]))
+
+    async def collect():
+        return [(tag, r) async for tag, r in stream_generate(backend, items, window=5, memo=memo)]
+
+    results = dict(asyncio.run(collect()))
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert [results[i].text for i in range(5)] == ["A", "B", "A", "C", "A"]
+    assert all(results[i].request_id == f"q{i}" for i in range(5))
+    assert backend.dispatched == ["q0", "q1", "q3"]
+    memo.close()
+
+
+def test_without_db_nothing_outlives_the_window():
+    backend = _CountingBackend()
+    memo = ResponseMemo()
+    items = ((i, _req(i, text)) for i, text in enumerate(["a", "b", "a"]))
+
+    async def collect():
+        return [r async for _, r in stream_generate(backend, items, window=1, memo=memo)]
+
+    assert [r.text for r in asyncio.run(collect())] == ["A", "B", "A"]
+    assert backend.dispatched == ["q0", "q1", "q2"]  # "a" was no longer in flight
+    assert memo.get(ResponseMemo.key(_req(0, "a"), "test-model")) is None
+    memo.close()
+
+
+def _counters(results):
+    metrics = RunMetrics()
+    for result in results:
+        metrics.record_llm(result)
+    return metrics.counters
+
+
+def test_metrics_count_only_dispatched_calls(tmp_path):
+    backend = _CountingBackend()
+    memo = ResponseMemo(tmp_path / "memo.db")
+    batch = [_req(i, "same") for i in range(5)] + [_req(5, "boom"), _req(6, "boom")]
+    counters = _counters(asyncio.run(memo.run_batched(backend, batch)))
+    assert backend.dispatched == ["q0", "q5"]
+    assert counters["llm_calls"] == 1
+    assert (counters["input_tokens"], counters["output_tokens"]) == (100, 1)
+    assert counters["cache_hits"] == 4
+    assert counters["llm_failures"] == 2 and counters["retries"] == 1  # retried once, not once per twin
+
+    # memo hits on the next run count as hits too
+    counters = _counters(asyncio.run(memo.run_batched(backend, [_req(7, "same"), _req(8, "same")])))
+    assert counters.get("llm_calls", 0) == 0 and counters["cache_hits"] == 2
+    memo.close()
+
+
+def test_metrics_count_streamed_twins_once():
+    backend = _CountingBackend()
+    memo = ResponseMemo()
+    items = ((i, _req(i, "same")) for i in range(5))
+
+    async def collect():
+        return [r async for _, r in stream_generate(backend, items, window=5, memo=memo)]
+
+    counters = _counters(asyncio.run(collect()))
+    assert len(backend.dispatched) == 1
+    assert (counters["llm_calls"], counters["input_tokens"], counters["cache_hits"]) == (1, 100, 4)
+    memo.close()
@@ -0,0 +1,47 @@
+"""Checks the memory-mapped response store against loading the run files directly."""
+
+import contextlib
+import io
+from pathlib import Path
+
+from autojudge_base.io import load_runs_failsave
+
+from judges.shared.response_store import ResponseStore, convert, load_responses
+
+RUNS = Path(__file__).parent.parent / "data" / "kiddie" / "runs" / "repgen"
+
+
+def _load_runs():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_runs_failsave(RUNS)
+
+
+def test_store_round_trips_reports(tmp_path):
+    stats = convert(RUNS, tmp_path / "store")
+    reference = _load_runs()
+    reports = ResponseStore(tmp_path / "store").reports()
+
+    assert stats.reports == len(reference) == len(reports)
+    assert stats.unique_documents <= stats.documents
+    for expected, lazy in zip(reference, reports):
+        assert lazy.metadata == expected.metadata
+        assert lazy.get_report_text() == expected.get_report_text()
+        assert lazy.materialize().model_dump() == expected.model_dump()
+        assert lazy.path == expected.path
+
+
+def test_store_seeks_runs_and_topics_and_skips_documents(tmp_path):
+    convert(RUNS, tmp_path / "store")
+    store = ResponseStore(tmp_path / "store")
+    reference = _load_runs()
+
+    selected = store.reports(run_ids=["run2", "run4"], topic_ids=["leaf"])
+    assert [(r.metadata.run_id, r.metadata.topic_id) for r in selected] == [
+        (r.metadata.run_id, r.metadata.topic_id) for r in reference
+        if r.metadata.run_id in ("run2", "run4") and r.metadata.topic_id == "leaf"
+    ]
+    assert all(r._report is None for r in selected)  # index only, nothing parsed yet
+
+    lean = load_responses(tmp_path / "store", run_ids=["run1"], documents=False)
+    assert lean and all(r.metadata.run_id == "run1" and r.documents is None for r in lean)
+    assert all(r.responses for r in lean)
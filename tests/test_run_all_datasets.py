@@ -0,0 +1,172 @@
+"""Checks the batch driver's scheduling without running a real judge.
+
+A stand-in `auto-judge` executable is put first on PATH: it writes a
+leaderboard into --out-dir, or exits non-zero when the responses path
+contains "fail", optionally after sleeping (a "slow" responses path), so
+the tests exercise ordering, per-job logs, and fail-fast cancellation.
+"""
+
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import run_all_datasets as rad
+
+FAKE_AUTO_JUDGE = f"""#!{sys.executable}
+import sys, time
+from pathlib import Path
+args = sys.argv[1:]
+out = Path(args[args.index("--out-dir") + 1])
+responses = args[args.index("--rag-responses") + 1]
+print("fake auto-judge", " ".join(args))
+if "slow" in responses:
+    time.sleep(30)
+if "fail" in responses:
+    sys.exit(3)
+(out / "fake.eval.txt").write_text("run1\\tall\\tSCORE\\t1.0\\n")
+"""
+
+
+@pytest.fixture
+def fake_auto_judge(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    exe = bin_dir / "auto-judge"
+    exe.write_text(FAKE_AUTO_JUDGE)
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    return exe
+
+
+def _dataset(name: str, responses: str) -> rad.Dataset:
+    return rad.Dataset(name=name, responses=responses, topics="topics.jsonl")
+
+
+WORKFLOW = Path("judges/naive/workflow.yml")
+
+
+def test_parallel_keep_going_reports_in_dataset_order(fake_auto_judge, tmp_path):
+    datasets = [_dataset("b", "ok"), _dataset("a", "fail"), _dataset("c", "ok")]
+    results = rad.run_parallel(WORKFLOW, datasets, tmp_path / "out", "all", "all", [], jobs=3, keep_going=True)
+
+    assert list(results) == ["b/naive/default-all-all", "a/naive/default-all-all", "c/naive/default-all-all"]
+    assert list(results.values()) == ["OK", "FAILED", "OK"]
+    for key in results:
+        log = rad.log_file(tmp_path / "out" / key)
+        assert "fake auto-judge" in log.read_text()
+    assert (tmp_path / "out" / "b/naive/default-all-all/fake.eval.txt").exists()
+
+
+def test_parallel_fail_fast_cancels_remaining(fake_auto_judge, tmp_path):
+    datasets = [_dataset("slow", "slow"), _dataset("bad", "fail"), _dataset("queued", "slow-too")]
+    results = rad.run_parallel(WORKFLOW, datasets, tmp_path / "out", "all", "all", [], jobs=2)
+
+    assert results["bad/naive/default-all-all"] == "FAILED"
+    assert results["slow/naive/default-all-all"] == "CANCELLED"  # terminated, not waited for
+    assert results["queued/naive/default-all-all"] == "CANCELLED"  # never started, or terminated
+
+
+def test_parallel_reports_failing_hooks(fake_auto_judge, tmp_path, monkeypatch):
+    def post_hooks(workflow, dataset, *args):
+        if dataset.name == "b":
+            raise RuntimeError("upload refused")
+
+    monkeypatch.setattr(rad, "run_post_hooks", post_hooks)
+    results = rad.run_parallel(WORKFLOW, [_dataset("a", "ok"), _dataset("b", "ok")], tmp_path / "out", "all", "all", [],
+                               jobs=2, upload_tira=True)
+
+    assert results == {"a/naive/default-all-all": "OK", "b/naive/default-all-all": "HOOK FAILED"}
+    assert "upload refused" in rad.log_file(tmp_path / "out" / "b/naive/default-all-all").read_text()
+
+
+def test_job_cancelled_before_start_keeps_previous_manifest_and_log(fake_auto_judge, tmp_path, monkeypatch):
+    out = tmp_path / "out"
+    queued = _dataset("queued", "ok")
+    assert rad.run_workflow(WORKFLOW, queued, out, "all", "all", [])
+    queued_out = rad.run_dir(out, WORKFLOW, "queued", None, "all", "all")
+    manifest = rad.manifest_file(queued_out).read_text()
+    rad.log_file(queued_out).write_text("previous log\n")
+
+    # Hold the queued job in its fingerprinting until the failing job has cancelled the rest
+    run_fingerprint = rad.run_fingerprint
+
+    def slow_fingerprint(workflow, dataset, *args, **kwargs):
+        if dataset.name == "queued":
+            time.sleep(1.0)
+        return run_fingerprint(workflow, dataset, *args, **kwargs)
+
+    monkeypatch.setattr(rad, "run_fingerprint", slow_fingerprint)
+    results = rad.run_parallel(WORKFLOW, [_dataset("bad", "fail"), queued], out, "all", "all", [], jobs=2)
+
+    assert results["queued/naive/default-all-all"] == "CANCELLED"
+    assert rad.manifest_file(queued_out).read_text() == manifest
+    assert rad.log_file(queued_out).read_text() == "previous log\n"
+
+
+def test_manifest_matches_until_an_input_changes(fake_auto_judge, tmp_path):
+    (tmp_path / "responses").mkdir()
+    (tmp_path / "responses" / "run1.jsonl").write_text("{}\n")
+    (tmp_path / "topics.jsonl").write_text("{}\n")
+    workflow = tmp_path / "judge" / "workflow.yml"
+    workflow.parent.mkdir()
+    workflow.write_text("settings: {filebase: x}\nvariants:\n  a: {k: 1}\n  b: {k: 2}\n")
+    dataset = rad.Dataset(name="ds", responses=str(tmp_path / "responses"), topics=str(tmp_path / "topics.jsonl"))
+    out = tmp_path / "out"
+
+    def fingerprint():
+        return rad.run_fingerprint(workflow, dataset, "all", "all", [], variant="a")
+
+    assert rad.run_workflow(workflow, dataset, out, "all", "all", [], variant="a")
+    dataset_out = rad.run_dir(out, workflow, "ds", "a", "all", "all")
+    assert rad.manifest_matches(dataset_out, fingerprint())
+
+    # Editing a variant that is not being run leaves the finished run valid ...
+    workflow.write_text("settings: {filebase: x}\nvariants:\n  a: {k: 1}\n  b: {k: 3}\n")
+    assert rad.manifest_matches(dataset_out, fingerprint())
+    # ... but different extra args, or changed responses, do not
+    assert not rad.manifest_matches(dataset_out, rad.run_fingerprint(workflow, dataset, "all", "all", ["--limit-runs", "1"], variant="a"))
+    (tmp_path / "responses" / "run2.jsonl").write_text("{}\n")
+    assert not rad.manifest_matches(dataset_out, fingerprint())
+
+
+def test_unchanged_inputs_are_not_hashed_again(fake_auto_judge, tmp_path, monkeypatch):
+    (tmp_path / "responses").mkdir()
+    (tmp_path / "responses" / "run1.jsonl").write_text("{}\n")
+    (tmp_path / "topics.jsonl").write_text("{}\n")
+    dataset = rad.Dataset(name="ds", responses=str(tmp_path / "responses"), topics=str(tmp_path / "topics.jsonl"))
+    out = tmp_path / "out"
+    assert rad.run_workflow(WORKFLOW, dataset, out, "all", "all", [])
+    dataset_out = rad.run_dir(out, WORKFLOW, "ds", None, "all", "all")
+
+    hashed = []
+    sha256_path = rad._sha256_path
+    monkeypatch.setattr(rad, "_sha256_path", lambda path: hashed.append(path.name) or sha256_path(path))
+
+    def fingerprint():
+        return rad.run_fingerprint(WORKFLOW, dataset, "all", "all", [], None,
+                                   rad.input_stats(dataset), rad.read_manifest(dataset_out))
+
+    assert rad.manifest_matches(dataset_out, fingerprint())
+    assert hashed == []
+    (tmp_path / "responses" / "run1.jsonl").write_text("{}\n{}\n")
+    assert not rad.manifest_matches(dataset_out, fingerprint())
+    assert hashed == ["responses"]
+
+
+def test_metrics_table_sums_each_runs_metrics_files(tmp_path):
+    from judges.shared.metrics import RunMetrics
+
+    run = tmp_path / "ds/judge/default-all-all"
+    for filebase, hit in (("a", True), ("b", False)):
+        m = RunMetrics()
+        m.count("responses", 2)
+        m.record_llm(type("Result", (), {"text": "1", "cached": hit, "input_tokens": 7, "output_tokens": 1})(), 0.2)
+        m.write(run / filebase)
+
+    header, row = rad.metrics_table(tmp_path, ["ds/judge/default-all-all", "missing/run"])
+    assert header.split()[:4] == ["run", "wall_s", "responses", "llm_calls"]
+    assert row.split()[2:] == ["4", "1", "7", "1", "50%", "0"]
@@ -0,0 +1,75 @@
+"""Checks sweepable judge parameters: one feature pass, one leaderboard per grid point."""
+
+import contextlib
+import io
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from autojudge_base import Request
+from autojudge_base.io import load_runs_failsave
+
+from judges.complete_example.example_judge import ExampleLeaderboardJudge, score_grid
+from judges.shared.sweepable import point_filebase, sweep_grid, write_point_leaderboard
+
+DATA = Path(__file__).parent.parent / "data" / "kiddie"
+
+
+def _scalar_score(base: float, has: bool, nuggets: int, bonus: float) -> float:
+    score = base
+    if has:
+        score = min(score + bonus, 1.0)
+    if nuggets > 0:
+        score = min(score + 0.05 * nuggets, 1.0)
+    return score
+
+
+def test_score_grid_matches_scalar_scoring_exactly():
+    rng = random.Random(0)
+    base = [min(rng.randint(0, 1500) / 1000.0, 1.0) for _ in range(500)]
+    has = [rng.random() < 0.5 for _ in base]
+    nuggets = [rng.choice([0, 0, 1, 3, 5]) for _ in base]
+    bonuses = [0.1, 0.2, 0.3, 0.4]
+
+    grid = score_grid(np.array(base), np.array(has), np.array(nuggets), np.array(bonuses))
+
+    assert grid.shape == (len(bonuses), len(base))
+    for row, bonus in zip(grid.tolist(), bonuses):
+        assert row == [_scalar_score(b, h, n, bonus) for b, h, n in zip(base, has, nuggets)]
+
+
+def test_sweep_grid_and_point_filebase():
+    assert sweep_grid({"keyword_bonus": 0.2}, ("keyword_bonus",)) == [{"keyword_bonus": 0.2}]
+    assert sweep_grid({"a": [1, 2], "b": [3, 4], "c": 5}, ("a", "b")) == [
+        {"a": 1, "b": 3}, {"a": 1, "b": 4}, {"a": 2, "b": 3}, {"a": 2, "b": 4},
+    ]
+    with pytest.raises(ValueError):
+        sweep_grid({"keyword_bonus": []}, ("keyword_bonus",))
+
+    path = point_filebase("{filebase}-b{keyword_bonus}", "/out/complete_example", {"keyword_bonus": 0.1})
+    assert path == Path("/out/complete_example-b0.1")
+
+
+def test_judge_writes_only_the_points_the_runner_does_not(tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        reports = load_runs_failsave(DATA / "runs" / "repgen")
+    topics = [Request(**json.loads(line)) for line in (DATA / "topics" / "kiddie-topics.jsonl").read_text().splitlines() if line]
+
+    def judge(filebase, keyword_bonus):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ExampleLeaderboardJudge().judge(reports, topics, None, keyword_bonus=keyword_bonus,
+                                                   filebase=str(tmp_path / filebase))
+
+    first = judge("sweep", [0.1, 0.2, 0.3])
+    assert sorted(p.name for p in tmp_path.glob("*.eval.txt")) == ["sweep-b0.2.eval.txt", "sweep-b0.3.eval.txt"]
+
+    def written(leaderboard, name):
+        return write_point_leaderboard(leaderboard, tmp_path / "scalar" / name, topics).read_bytes()
+
+    # the returned leaderboard is the first point; each point file matches a scalar run
+    assert written(first, "first") == written(judge("scalar", 0.1), "b0.1")
+    for bonus in (0.2, 0.3):
+        assert (tmp_path / f"sweep-b{bonus}.eval.txt").read_bytes() == written(judge("scalar", bonus), f"b{bonus}")
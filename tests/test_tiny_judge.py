@@ -0,0 +1,133 @@
+"""Checks TinyJudge dispatch against a stand-in backend (no network)."""
+
+import contextlib
+import io
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+minima_llm = pytest.importorskip("minima_llm")
+from minima_llm import MinimaLlmFailure, MinimaLlmResponse  # noqa: E402
+
+from autojudge_base import Request  # noqa: E402
+from autojudge_base.io import load_runs_failsave  # noqa: E402
+
+from judges.tinyjudge import tiny_judge  # noqa: E402
+from judges.tinyjudge.tiny_judge import TinyJudge  # noqa: E402
+
+DATA = Path(__file__).parent.parent / "data" / "kiddie"
+
+
+class _Backend:
+    """Answers "1" for texts with an even number of characters; `fail_after` batches, then raises.
+
+    Packed calls get a JSON list, except the first `malformed_packed` ones, which get a broken answer.
+    """
+
+    fail_after = None
+    malformed_packed = 0
+
+    def __init__(self, cfg):
+        self.cfg = SimpleNamespace(model="test-model", max_outstanding=1)
+        self.batches = 0
+        self.packed = 0
+
+    async def run_batched(self, requests):
+        if self.fail_after is not None and self.batches >= self.fail_after:
+            raise RuntimeError("killed")
+        self.batches += 1
+        return [MinimaLlmResponse(request_id=req.request_id, text=self.answer(req)) for req in requests]
+
+    async def generate(self, req):
+        return MinimaLlmResponse(request_id=req.request_id, text=self.answer(req))
+
+    @staticmethod
+    def relevant(text):
+        return 1 if len(text) % 2 == 0 else 0
+
+    def answer(self, req):
+        prompt = req.messages[-1]["content"]
+        if req.messages[0]["content"] != tiny_judge.PACKED_SYSTEM_PROMPT:
+            return str(self.relevant(prompt.split("\nText: ", 1)[1]))
+        self.packed += 1
+        if self.packed <= self.malformed_packed:
+            return "Sure! [1, 0"
+        texts = [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("Text ")]
+        return "```json\n" + json.dumps([self.relevant(text) for text in texts]) + "\n```"
+
+
+def _inputs():
+    with contextlib.redirect_stdout(io.StringIO()):
+        reports = load_runs_failsave(DATA / "runs" / "repgen")
+    topics = [Request(**json.loads(line)) for line in (DATA / "topics" / "kiddie-topics.jsonl").read_text().splitlines() if line]
+    return reports, topics
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://127.0.0.1:9/v1")
+    monkeypatch.setenv("OPENAI_MODEL", "test-model")
+    monkeypatch.setattr(tiny_judge, "OpenAIMinimaLlm", _Backend)
+    monkeypatch.setattr(_Backend, "fail_after", None)
+    monkeypatch.setattr(_Backend, "malformed_packed", 0)
+    return _Backend
+
+
+def _judge(tmp_path, **settings):
+    reports, topics = _inputs()
+    return TinyJudge().judge(reports, topics, SimpleNamespace(raw=None), filebase=str(tmp_path / "tiny"), **settings)
+
+
+def test_default_batches_are_journaled_as_they_return(tmp_path, backend):
+    backend.fail_after = 2
+    with pytest.raises(RuntimeError, match="killed"):
+        _judge(tmp_path, resume=False)
+    batch_size = tiny_judge.BATCH_CALLS_PER_SLOT  # max_outstanding=1
+    journal = (tmp_path / "tiny.journal.jsonl").read_text().splitlines()
+    assert len(journal) == 2 * batch_size
+
+    backend.fail_after = None
+    leaderboard = _judge(tmp_path)   # resumes the journaled pairs
+    assert len([e for e in leaderboard.entries if e.topic_id != "all"]) == 20
+
+
+def _scores(leaderboard):
+    return sorted((e.run_id, e.topic_id, e.values["FIRST_SENTENCE_RELEVANT"]) for e in leaderboard.entries)
+
+
+def test_streaming_with_prefix_lookahead_matches_batch(tmp_path, backend):
+    batch = _judge(tmp_path / "batch", resume=False)
+    streamed = _judge(tmp_path / "stream", resume=False, stream_window=2, prefix_lookahead=3)
+    assert _scores(streamed) == _scores(batch)
+
+
+@pytest.mark.parametrize("text, count, expected", [
+    ("[1, 0, 1]", 3, [1, 0, 1]),
+    ('Here you go: ```json\n["1", "0"]\n```', 2, [1, 0]),
+    ("[true, false]", 2, [1, 0]),
+    ("[1, 0]", 3, None),          # wrong length
+    ("1, 0, 1", 3, None),         # no list
+    ("[1, 0,", 2, None),          # not JSON
+    ("[1, 2]", 2, None),          # not 0/1
+    ('["yes", "no"]', 2, None),
+])
+def test_parse_relevance_list(text, count, expected):
+    result = MinimaLlmResponse(request_id="p0", text=text)
+    assert TinyJudge()._parse_relevance_list(result, count) == expected
+
+
+def test_parse_relevance_list_rejects_failures():
+    failure = MinimaLlmFailure(request_id="p0", error_type="HTTPError", message="500", attempts=1)
+    assert TinyJudge()._parse_relevance_list(failure, 1) is None
+
+
+def test_packed_calls_fall_back_to_single_calls(tmp_path, backend):
+    single = _judge(tmp_path / "single", resume=False, items_per_call=1)
+    backend.malformed_packed = 1
+    packed = _judge(tmp_path / "packed", resume=False, items_per_call=3)
+    assert _scores(packed) == _scores(single)
+
+    metrics = json.loads((tmp_path / "packed" / "tiny.metrics.json").read_text())
+    assert metrics["counters"]["fallback_items"] == 3  # the malformed call's items, re-judged one per call
@@ -0,0 +1,16 @@
+"""Checks that topic-sharded scoring gives the same results for any worker count."""
+
+from judges.shared.topic_pool import map_topics
+
+
+def _score(task):
+    topic_id, texts = task
+    return [(f"run{i}", {"SCORE": len(text) / 10, "TOPIC": topic_id}) for i, text in enumerate(texts)]
+
+
+def test_parallel_results_match_serial_in_task_order():
+    tasks = {f"t{n}": (f"t{n}", ["x" * k for k in range(n % 4)]) for n in range(12, 0, -1)}
+    serial = map_topics(_score, tasks, workers=1)
+    parallel = map_topics(_score, tasks, workers=3)
+    assert list(parallel) == list(tasks)
+    assert parallel == serial